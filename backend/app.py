@@ -1,13 +1,30 @@
 from fastapi import FastAPI, UploadFile, File, Body
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from utils.resume_parser import extract_text, compute_resume_score, generate_enhanced_resume
+from fastapi.responses import JSONResponse, StreamingResponse
+from utils.resume_parser import PARSER_VERSION, generate_enhanced_resume
+from utils.text_cache import load_extracted_text
+from utils.pdf_extractors import get_pdf_backend, read_pdf_text_parallel
+from utils.cache_store import JsonFileBackend, cache_dir, create_cache_store
+from utils.resume_features import extract_resume_features
+from utils.job_matching import analyze_resume_for_job, load_resume_file, match_resume_file, worker_failure_result
+from utils.job_rankings import JobRanking, merge_rankings, ranking_version, select_rankings
+from utils.resume_index import get_resume_index
+from utils.resume_scoring import score_resume_files
+from utils.tfidf_matching import apply_tfidf_match, tfidf_available
+from utils.upload_index import file_slot
+from utils.task_queue import cancel_tasks, gather_with_progress, get_task, submit_task, task_status
+from utils.workers import ServerBusy, analysis_slot, get_worker_count, run_in_process_pool, shutdown_process_pool
+import asyncio
 import os
 import hashlib
 import json
 import re
 import random
-from typing import Optional, Dict, Any
+import time
+import zipfile
+from io import BytesIO
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 # import spacy
 # import textstat
@@ -30,9 +47,11 @@ app.add_middleware(
 )
 
 uploads_dir = os.path.join(os.path.dirname(__file__), "uploads")
-cache_dir = os.path.join(os.path.dirname(__file__), "cache")
 os.makedirs(uploads_dir, exist_ok=True)
-os.makedirs(cache_dir, exist_ok=True)
+
+# Analysis results cached by file content. Entries from the original one-file-per-hash
+# layout in cache/ are still found and copied over on first use.
+analysis_cache = create_cache_store("analysis", json_dir=cache_dir, json_indent=2, fallback=JsonFileBackend(cache_dir))
 app.mount("/uploads", StaticFiles(directory=uploads_dir), name="uploads")
 
 # Load spaCy model (commented out for now)
@@ -45,29 +64,60 @@ nlp = None
 # Global variable to track current upload (single file restriction)
 current_upload = None
 
+# Bulk analysis limits
+RESUME_EXTENSIONS = ('.pdf', '.doc', '.docx')
+MAX_RESUME_SIZE = 5 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+BULK_MAX_FILES = 1000
+BULK_MAX_TOTAL_SIZE = 500 * 1024 * 1024
+# Uncached resumes sent to a worker at a time
+BULK_BATCH_SIZE = 8
+# Small uploads use smaller batches, so each worker gets at least this many (and task
+# progress moves in steps of a few files)
+BULK_MIN_BATCHES_PER_WORKER = 4
+
+@app.on_event("shutdown")
+def stop_worker_pool():
+    """Stop background tasks and the resume worker processes when the server shuts down."""
+    cancel_tasks()
+    shutdown_process_pool()
+
 def get_file_hash(file_content: bytes) -> str:
     """Generate a hash for the file content to use as cache key."""
     return hashlib.md5(file_content).hexdigest()
 
+async def read_upload(file: UploadFile, max_size: int = MAX_RESUME_SIZE, too_large: str = "File size exceeds 5MB"):
+    """
+    Read an upload in chunks, hashing it as it arrives and failing as soon as it grows
+    past max_size. Returns (content, md5 hex digest) with a single copy of the file in memory.
+    """
+    await file.seek(0)
+    digest = hashlib.md5()
+    buffer = BytesIO()
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        if buffer.tell() + len(chunk) > max_size:
+            raise ValueError(too_large)
+        digest.update(chunk)
+        buffer.write(chunk)
+    # getvalue() hands over the buffer's bytes without copying them
+    return buffer.getvalue(), digest.hexdigest()
+
 def load_cached_result(file_hash: str) -> Optional[dict]:
-    """Load cached analysis result if it exists."""
-    cache_file = os.path.join(cache_dir, f"{file_hash}.json")
-    if os.path.exists(cache_file):
-        try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading cache: {e}")
-    return None
+    """Load cached analysis result if it exists and was made by the current parser and PDF backend."""
+    cached_result = analysis_cache.get(file_hash)
+    # Results from an older parser (or another PDF backend) are analyzed again, like cached text
+    if cached_result is None or cached_result.get("parser_version") != PARSER_VERSION:
+        return None
+    if cached_result.get("pdf_backend") != get_pdf_backend().name:
+        return None
+    return cached_result
 
 def save_cached_result(file_hash: str, result: dict):
     """Save analysis result to cache."""
-    cache_file = os.path.join(cache_dir, f"{file_hash}.json")
-    try:
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2)
-    except Exception as e:
-        print(f"Error saving cache: {e}")
+    analysis_cache.set(file_hash, {**result, "parser_version": PARSER_VERSION, "pdf_backend": get_pdf_backend().name})
 
 def create_professional_pdf(sections, score, issues, output_path, title):
     """Create a professional PDF resume with corrections and improvements."""
@@ -239,120 +289,57 @@ def create_professional_pdf(sections, score, issues, output_path, title):
         print(f"PDF creation failed: {e}")
         return False
 
-@app.post("/api/analyze-resume")
-async def analyze_resume(file: UploadFile = File(...)):
-    global current_upload
+def cached_analysis_response(cached_result):
+    """Response for a resume whose analysis is already cached."""
+    return {
+        "success": True,
+        "cached": True,
+        "score": cached_result["score"],
+        "professionalism_score": cached_result["professionalism_score"],
+        "analysis_details": cached_result["analysis_details"],
+        "issues": cached_result["issues"],
+        "sections": cached_result["sections"],
+        "download_urls": cached_result["download_urls"],
+        "updated_resume_url": cached_result["updated_resume_url"],
+        "message": "This is your perfect score - it cannot be changed!"
+    }
+
+def build_analysis_result(filename, text, score, issues, sections, score_dict, features=None):
+    """Write the enhanced HTML resume and build the /api/analyze-resume response for a scored resume."""
+    if features is None:
+        features = extract_resume_features(text)
+    # Generate enhanced resume versions
+    public_urls = {}
     
-    try:
-        # Validate basic constraints
-        if hasattr(file, 'size') and file.size and file.size > 5 * 1024 * 1024:
-            raise ValueError("File size exceeds 5MB")
-        if not (file.filename.endswith('.pdf') or file.filename.endswith('.doc') or file.filename.endswith('.docx')):
-            raise ValueError("Unsupported file format")
+    # Create professional PDF resumes
+    safe_base = os.path.splitext(os.path.basename(filename))[0]
+    
+    # Create professional HTML resume (PDF-ready)
+    print("Creating professional HTML resume...")
+    html_file_path = os.path.join(uploads_dir, f"resume-{safe_base}.html")
+    
+    # Get name from contact or filename
+    name = sections.get('contact', {}).get('name', safe_base.replace('-', ' ').title())
+    
+    with open(html_file_path, 'w', encoding='utf-8') as f:
+        # Generic minimal professional template: section names + one-line summary
+        summary_text = sections.get('summary', '')
+        if isinstance(summary_text, list):
+            summary_text = ' '.join(summary_text)
+        summary_line = (summary_text or 'Professional candidate profile').strip().split('\n')[0][:160]
+        contact_items = []
+        contact = sections.get('contact', {}) or {}
+        for key in ('email', 'phone', 'linkedin'):
+            if contact.get(key):
+                contact_items.append(contact[key])
+        contact_line = ' • '.join(contact_items)
 
-        # Single file upload restriction
-        if current_upload is not None and current_upload != file.filename:
-            raise ValueError("Only one resume can be uploaded at a time. Please clear the current upload first.")
+        exp_count = len(sections.get('experience', []) or [])
+        edu_count = len(sections.get('education', []) or [])
+        skills = sections.get('skills', []) or []
+        skills_line = ', '.join(skills[:8])
 
-        # Save the uploaded file first so we can use it multiple times
-        file.file.seek(0)
-        file_content = file.file.read()
-        
-        # Generate file hash for caching
-        file_hash = get_file_hash(file_content)
-        
-        # Check if we have a cached result
-        cached_result = load_cached_result(file_hash)
-        if cached_result:
-            print(f"Returning cached result for {file.filename}")
-            return {
-                "success": True,
-                "cached": True,
-                "score": cached_result["score"],
-                "professionalism_score": cached_result["professionalism_score"],
-                "analysis_details": cached_result["analysis_details"],
-                "issues": cached_result["issues"],
-                "sections": cached_result["sections"],
-                "download_urls": cached_result["download_urls"],
-                "updated_resume_url": cached_result["updated_resume_url"],
-                "message": "This is your perfect score - it cannot be changed!"
-            }
-        
-        # Set current upload
-        current_upload = file.filename
-        
-        # Create a temporary file for processing
-        temp_file_path = os.path.join(uploads_dir, f"temp_{file.filename}")
-        with open(temp_file_path, 'wb') as temp_file:
-            temp_file.write(file_content)
-        
-        # Create a file-like object for text extraction
-        from io import BytesIO
-        file_obj = BytesIO(file_content)
-        file_obj.filename = file.filename
-        
-        # Simple text extraction for now
-        try:
-            text = extract_text(file_obj)
-            score, issues, sections, score_dict = compute_resume_score(text)
-        except:
-            # Fallback if complex parsing fails
-            text = "Sample resume text for analysis"
-            score = random.randint(70, 90)
-            issues = ["Add more technical skills", "Improve formatting", "Include quantifiable achievements"]
-            sections = {
-                "contact": {"email": "example@email.com", "phone": "123-456-7890"},
-                "summary": "Professional summary",
-                "experience": ["Work experience 1", "Work experience 2"],
-                "education": ["Education 1"],
-                "skills": ["Skill 1", "Skill 2", "Skill 3"],
-                "projects": [],
-                "achievements": []
-            }
-            score_dict = {
-                "grammar": random.randint(15, 20),
-                "structure": random.randint(20, 25),
-                "readability": random.randint(10, 15),
-                "keywords": random.randint(8, 15),
-                "contact": random.randint(6, 10),
-                "achievements": random.randint(3, 5),
-                "formatting": random.randint(6, 10),
-                "action_verbs": random.randint(3, 5),
-                "quantification": random.randint(2, 5)
-            }
-
-        # Generate enhanced resume versions
-        public_urls = {}
-        
-        # Create professional PDF resumes
-        safe_base = os.path.splitext(os.path.basename(file.filename))[0]
-        
-        # Create professional HTML resume (PDF-ready)
-        print("Creating professional HTML resume...")
-        html_file_path = os.path.join(uploads_dir, f"resume-{safe_base}.html")
-        
-        # Get name from contact or filename
-        name = sections.get('contact', {}).get('name', safe_base.replace('-', ' ').title())
-        
-        with open(html_file_path, 'w', encoding='utf-8') as f:
-            # Generic minimal professional template: section names + one-line summary
-            summary_text = sections.get('summary', '')
-            if isinstance(summary_text, list):
-                summary_text = ' '.join(summary_text)
-            summary_line = (summary_text or 'Professional candidate profile').strip().split('\n')[0][:160]
-            contact_items = []
-            contact = sections.get('contact', {}) or {}
-            for key in ('email', 'phone', 'linkedin'):
-                if contact.get(key):
-                    contact_items.append(contact[key])
-            contact_line = ' • '.join(contact_items)
-
-            exp_count = len(sections.get('experience', []) or [])
-            edu_count = len(sections.get('education', []) or [])
-            skills = sections.get('skills', []) or []
-            skills_line = ', '.join(skills[:8])
-
-            f.write(f"""<!DOCTYPE html>
+        f.write(f"""<!DOCTYPE html>
 <html>
 <head>
   <meta charset="UTF-8" />
@@ -388,61 +375,133 @@ async def analyze_resume(file: UploadFile = File(...)):
   <div class="footer">Generated by SGP Resume Analyzer</div>
 </body>
 </html>""")
+    
+    # Create both HTML and PDF versions
+    public_urls["corrected_html"] = f"/uploads/{os.path.basename(html_file_path)}"
+    public_urls["corrected_pdf"] = f"/uploads/{os.path.basename(html_file_path)}"
+    public_urls["professional_pdf"] = f"/uploads/{os.path.basename(html_file_path)}"
+    print(f"Professional HTML resume created: {html_file_path}")
+    
+    # Create detailed analysis result
+    analysis_details = {
+        "word_count": features.word_count,
+        "sections_found": len([s for s in sections.values() if s]),
+        "has_email": bool(sections.get('contact', {}).get('email')),
+        "has_phone": bool(sections.get('contact', {}).get('phone')),
+        "bullet_count": features.bullet_count,
+        "achievement_count": features.achievement_word_count
+    }
+    
+    # Create professionalism score breakdown using detailed score_dict
+    professionalism_score = {
+        "grammar": score_dict["grammar"],
+        "structure": score_dict["structure"],
+        "readability": score_dict["readability"],
+        "keywords": score_dict["keywords"],
+        "contact_info": score_dict["contact"],
+        "achievements": score_dict["achievements"],
+        "formatting": score_dict["formatting"],
+        "action_verbs": score_dict["action_verbs"],
+        "quantification": score_dict["quantification"]
+    }
+    
+    return {
+        "success": True,
+        "cached": False,
+        "score": score,
+        "professionalism_score": professionalism_score,
+        "analysis_details": analysis_details,
+        "issues": issues,
+        "sections": sections,
+        "download_urls": public_urls,
+        "updated_resume_url": public_urls.get("corrected_pdf") or public_urls.get("corrected_docx"),
+        "message": "Resume analyzed successfully!"
+    }
+
+@app.post("/api/analyze-resume")
+async def analyze_resume(file: UploadFile = File(...)):
+    global current_upload
+    
+    try:
+        # Validate basic constraints
+        if hasattr(file, 'size') and file.size and file.size > 5 * 1024 * 1024:
+            raise ValueError("File size exceeds 5MB")
+        if not (file.filename.endswith('.pdf') or file.filename.endswith('.doc') or file.filename.endswith('.docx')):
+            raise ValueError("Unsupported file format")
+
+        # Single file upload restriction
+        if current_upload is not None and current_upload != file.filename:
+            raise ValueError("Only one resume can be uploaded at a time. Please clear the current upload first.")
+
+        # Read the upload in chunks, computing the cache key hash and enforcing the size limit as it arrives
+        file_content, file_hash = await read_upload(file)
         
-        # Create both HTML and PDF versions
-        public_urls["corrected_html"] = f"/uploads/{os.path.basename(html_file_path)}"
-        public_urls["corrected_pdf"] = f"/uploads/{os.path.basename(html_file_path)}"
-        public_urls["professional_pdf"] = f"/uploads/{os.path.basename(html_file_path)}"
-        print(f"Professional HTML resume created: {html_file_path}")
-        
-        # Clean up temp file
-        try:
-            os.remove(temp_file_path)
-        except:
-            pass
-
-        # Create detailed analysis result
-        analysis_details = {
-            "word_count": len(text.split()),
-            "sections_found": len([s for s in sections.values() if s]),
-            "has_email": bool(sections.get('contact', {}).get('email')),
-            "has_phone": bool(sections.get('contact', {}).get('phone')),
-            "bullet_count": len([line for line in text.split('\n') if line.strip().startswith(('•', '-', '*'))]),
-            "achievement_count": len([word for word in text.lower().split() if word in ['achieved', 'increased', 'improved', 'reduced', 'developed', 'created', 'managed', 'led', 'implemented']])
-        }
-        
-        # Create professionalism score breakdown using detailed score_dict
-        professionalism_score = {
-            "grammar": score_dict["grammar"],
-            "structure": score_dict["structure"],
-            "readability": score_dict["readability"],
-            "keywords": score_dict["keywords"],
-            "contact_info": score_dict["contact"],
-            "achievements": score_dict["achievements"],
-            "formatting": score_dict["formatting"],
-            "action_verbs": score_dict["action_verbs"],
-            "quantification": score_dict["quantification"]
-        }
+        # Check if we have a cached result
+        cached_result = await asyncio.to_thread(load_cached_result, file_hash)
+        if cached_result:
+            print(f"Returning cached result for {file.filename}")
+            return cached_analysis_response(cached_result)
         
-        result = {
-            "success": True,
-            "cached": False,
-            "score": score,
-            "professionalism_score": professionalism_score,
-            "analysis_details": analysis_details,
-            "issues": issues,
-            "sections": sections,
-            "download_urls": public_urls,
-            "updated_resume_url": public_urls.get("corrected_pdf") or public_urls.get("corrected_docx"),
-            "message": "Resume analyzed successfully!"
-        }
+        # Set current upload
+        current_upload = file.filename
         
-        # Cache the result
-        save_cached_result(file_hash, result)
+        async with analysis_slot():
+            # Text extraction (shared, content-addressed text cache) and scoring run in the
+            # worker pool; analysis_slot bounds how many uploads do this at once
+            fallback = False
+            try:
+                raw_text = None
+                if file.filename.lower().endswith('.pdf') and await asyncio.to_thread(load_extracted_text, file_hash) is None:
+                    # Long PDFs have their pages read in parallel across the worker pool
+                    raw_text = await read_pdf_text_parallel(file_content)
+                scored = (await run_in_process_pool(score_resume_files, [(file_content, file.filename, file_hash, raw_text)]))[0]
+                if "error" in scored:
+                    raise Exception(scored["error"])
+                text, score, issues = scored["text"], scored["score"], scored["issues"]
+                sections, score_dict = scored["sections"], scored["score_dict"]
+                features = scored["features"]
+            except Exception as e:
+                # Fallback if complex parsing fails
+                print(f"Resume analysis failed for {file.filename}, using fallback result: {str(e)}")
+                fallback = True
+                text = "Sample resume text for analysis"
+                features = None
+                score = random.randint(70, 90)
+                issues = ["Add more technical skills", "Improve formatting", "Include quantifiable achievements"]
+                sections = {
+                    "contact": {"email": "example@email.com", "phone": "123-456-7890"},
+                    "summary": "Professional summary",
+                    "experience": ["Work experience 1", "Work experience 2"],
+                    "education": ["Education 1"],
+                    "skills": ["Skill 1", "Skill 2", "Skill 3"],
+                    "projects": [],
+                    "achievements": []
+                }
+                score_dict = {
+                    "grammar": random.randint(15, 20),
+                    "structure": random.randint(20, 25),
+                    "readability": random.randint(10, 15),
+                    "keywords": random.randint(8, 15),
+                    "contact": random.randint(6, 10),
+                    "achievements": random.randint(3, 5),
+                    "formatting": random.randint(6, 10),
+                    "action_verbs": random.randint(3, 5),
+                    "quantification": random.randint(2, 5)
+                }
+
+            result = await asyncio.to_thread(build_analysis_result, file.filename, text, score, issues, sections, score_dict, features)
+            public_urls = result["download_urls"]
+
+            # Cache the result (never the fallback, so the upload is analyzed again next time)
+            if not fallback:
+                await asyncio.to_thread(save_cached_result, file_hash, result)
         
         print(f"Final score for {file.filename}: {score}")
         print(f"Download URLs generated: {public_urls}")
         return result
+    except ServerBusy as e:
+        print(f"Rejecting {file.filename}: {str(e)}")
+        return JSONResponse(status_code=503, content={"error": str(e)}, headers={"Retry-After": "5"})
     except Exception as e:
         print(f"Error processing {file.filename}: {str(e)}")
         return {"error": f"Resume analysis failed: {str(e)}"}
@@ -454,6 +513,214 @@ async def clear_upload():
     current_upload = None
     return {"success": True, "message": "Upload cleared successfully"}
 
+def read_zip_member(archive, member):
+    """Read a zip member, stopping past MAX_RESUME_SIZE whatever size its header claims."""
+    with archive.open(member) as f:
+        return f.read(MAX_RESUME_SIZE + 1)
+
+def expand_bulk_upload(filename, file_content, entries, errors, max_size=BULK_MAX_TOTAL_SIZE):
+    """
+    Add a resume (or every resume inside a zip archive) to entries as (filename, content).
+    Returns the bytes a zip archive expanded to; archives expanding past max_size are
+    rejected before any member is read.
+    """
+    if filename.lower().endswith('.zip'):
+        try:
+            archive = zipfile.ZipFile(BytesIO(file_content))
+        except zipfile.BadZipFile:
+            errors.append({"filename": filename, "error": "Invalid zip archive"})
+            return 0
+        with archive:
+            members = []
+            for member in archive.infolist():
+                name = member.filename
+                if member.is_dir() or name.startswith('__MACOSX/') or os.path.basename(name).startswith('.'):
+                    continue
+                if not name.lower().endswith(RESUME_EXTENSIONS):
+                    errors.append({"filename": name, "error": "Unsupported file format"})
+                    continue
+                if member.file_size > MAX_RESUME_SIZE:
+                    errors.append({"filename": name, "error": "File size exceeds 5MB"})
+                    continue
+                if len(entries) + len(members) >= BULK_MAX_FILES:
+                    raise ValueError(f"Too many resumes (maximum {BULK_MAX_FILES})")
+                members.append(member)
+            expanded_size = sum(member.file_size for member in members)
+            if expanded_size > max_size:
+                raise ValueError("Total upload size exceeds limit")
+            expanded_size = 0
+            for member in members:
+                member_content = read_zip_member(archive, member)
+                if len(member_content) > MAX_RESUME_SIZE:
+                    errors.append({"filename": member.filename, "error": "File size exceeds 5MB"})
+                    continue
+                expanded_size += len(member_content)
+                if expanded_size > max_size:
+                    # Members can be larger than their headers say
+                    raise ValueError("Total upload size exceeds limit")
+                entries.append((os.path.basename(member.filename), member_content))
+        return expanded_size
+
+    if not filename.lower().endswith(RESUME_EXTENSIONS):
+        errors.append({"filename": filename, "error": "Unsupported file format"})
+    elif len(file_content) > MAX_RESUME_SIZE:
+        errors.append({"filename": filename, "error": "File size exceeds 5MB"})
+    elif len(entries) >= BULK_MAX_FILES:
+        raise ValueError(f"Too many resumes (maximum {BULK_MAX_FILES})")
+    else:
+        entries.append((filename, file_content))
+    return 0
+
+def finish_bulk_result(scored):
+    """Build and cache the analysis result for a resume scored by a worker."""
+    result = build_analysis_result(scored["filename"], scored["text"], scored["score"],
+                                   scored["issues"], scored["sections"], scored["score_dict"],
+                                   scored["features"])
+    save_cached_result(scored["hash"], result)
+    return result
+
+async def read_bulk_uploads(files):
+    """
+    Read uploaded files, expanding zip archives. Returns (entries, errors).
+    The uploads and the contents of their archives share BULK_MAX_TOTAL_SIZE.
+    """
+    entries = []
+    errors = []
+    total_size = 0
+    for file in files:
+        file_content, _ = await read_upload(file, BULK_MAX_TOTAL_SIZE - total_size, "Total upload size exceeds limit")
+        total_size += len(file_content)
+        # Inflating archives is heavy work, kept off the event loop
+        total_size += await asyncio.to_thread(expand_bulk_upload, file.filename, file_content, entries, errors,
+                                              BULK_MAX_TOTAL_SIZE - total_size)
+    return entries, errors
+
+async def score_bulk_chunk(chunk, slots):
+    """
+    Score a chunk of uncached resumes in the worker pool once one of slots is free;
+    returns (chunk, results or exception).
+    """
+    async with slots:
+        try:
+            return chunk, await run_in_process_pool(score_resume_files, [(*item[:3], None) for item in chunk])
+        except Exception as e:
+            return chunk, e
+
+def plan_bulk_entries(entries):
+    """
+    Hash bulk entries, deduplicate them by content and look them up in the analysis cache.
+    Returns (results with cached entries filled in, hash of each entry, index of the first
+    entry with each hash, uncached (content, filename, hash, index) items, cache hits).
+    """
+    results = [None] * len(entries)
+    hashes = []
+    first_index = {}
+    pending = []
+    cache_hits = 0
+    for i, (filename, file_content) in enumerate(entries):
+        file_hash = get_file_hash(file_content)
+        hashes.append(file_hash)
+        # Later copies point at the first file with that content
+        if file_hash in first_index:
+            continue
+        first_index[file_hash] = i
+        cached_result = load_cached_result(file_hash)
+        if cached_result:
+            cache_hits += 1
+            results[i] = {"filename": filename, **cached_analysis_response(cached_result)}
+        else:
+            pending.append((file_content, filename, file_hash, i))
+    return results, hashes, first_index, pending, cache_hits
+
+async def analyze_bulk_entries(entries, errors, on_progress=None, started=None):
+    """
+    Analyze (filename, content) entries and build the /api/analyze-resumes response.
+    on_progress(completed) is called as files finish.
+    """
+    started = started or time.perf_counter()
+
+    # Hashing and cache lookups of every entry run in a thread, off the event loop
+    results, hashes, first_index, pending, cache_hits = await asyncio.to_thread(plan_bulk_entries, entries)
+
+    completed = len(entries) - len(pending)
+    if on_progress:
+        on_progress(completed)
+
+    # Score uncached files in fixed-size batches (each worker batches its spaCy calls over
+    # one), handing a batch to the pool only when a worker is free for it
+    processing_started = time.perf_counter()
+    batch_size = min(BULK_BATCH_SIZE, -(-len(pending) // (BULK_MIN_BATCHES_PER_WORKER * get_worker_count()))) or 1
+    chunks = [pending[n:n + batch_size] for n in range(0, len(pending), batch_size)]
+    worker_count = min(get_worker_count(), len(chunks))
+    slots = asyncio.Semaphore(max(worker_count, 1))
+
+    extract_seconds = 0.0
+    score_seconds = 0.0
+    for next_done in asyncio.as_completed([score_bulk_chunk(chunk, slots) for chunk in chunks]):
+        chunk, scored_chunk = await next_done
+        if isinstance(scored_chunk, Exception):
+            for _, filename, _, i in chunk:
+                results[i] = {"filename": filename, "error": f"Resume analysis failed: {scored_chunk}"}
+            completed += len(chunk)
+            if on_progress:
+                on_progress(completed)
+            continue
+        # Progress moves per file while the batch's results are built and cached
+        for (_, filename, _, i), scored in zip(chunk, scored_chunk):
+            if "error" in scored:
+                results[i] = {"filename": filename, "error": f"Resume analysis failed: {scored['error']}"}
+            else:
+                extract_seconds += scored["extract_seconds"]
+                score_seconds += scored["score_seconds"]
+                result = await asyncio.to_thread(finish_bulk_result, scored)
+                results[i] = {"filename": filename, **result}
+            completed += 1
+            if on_progress:
+                on_progress(completed)
+    processing_seconds = time.perf_counter() - processing_started
+
+    for i, (filename, _) in enumerate(entries):
+        if results[i] is None:
+            original = first_index[hashes[i]]
+            results[i] = {**results[original], "filename": filename, "duplicateOf": entries[original][0]}
+
+    results.extend(errors)
+    failed = sum(1 for result in results if "error" in result)
+    total_seconds = time.perf_counter() - started
+    print(f"Bulk analysis: {len(results)} files, {len(pending)} analyzed, {cache_hits} cached, "
+          f"{failed} failed in {total_seconds:.2f}s")
+    return {
+        "success": True,
+        "totalFiles": len(results),
+        "analyzedCount": len(pending),
+        "cachedCount": cache_hits,
+        "duplicateCount": len(entries) - len(first_index),
+        "failedCount": failed,
+        "results": results,
+        "timing": {
+            "totalSeconds": round(total_seconds, 3),
+            "processingSeconds": round(processing_seconds, 3),
+            "extractSeconds": round(extract_seconds, 3),
+            "scoreSeconds": round(score_seconds, 3),
+            "workers": worker_count,
+        },
+    }
+
+@app.post("/api/analyze-resumes")
+async def analyze_resumes(files: List[UploadFile] = File(...)):
+    """
+    Analyze many resumes at once. Accepts PDF/DOC/DOCX files and zip archives of them.
+    Files are deduplicated by content hash and served from the analysis cache when possible;
+    the rest are extracted and scored in parallel on the worker pool.
+    """
+    started = time.perf_counter()
+    try:
+        entries, errors = await read_bulk_uploads(files)
+        return await analyze_bulk_entries(entries, errors, started=started)
+    except Exception as e:
+        print(f"Error in bulk resume analysis: {str(e)}")
+        return {"error": f"Bulk resume analysis failed: {str(e)}"}
+
 @app.get("/")
 async def root():
     """Root endpoint to verify server is running."""
@@ -463,7 +730,15 @@ async def root():
         "docs": "/docs",
         "endpoints": {
             "analyze_resume": "/api/analyze-resume",
-            "clear_upload": "/api/clear-upload"
+            "analyze_resumes": "/api/analyze-resumes",
+            "clear_upload": "/api/clear-upload",
+            "cache_stats": "/api/cache/stats",
+            "analyze_resumes_for_job": "/api/analyze-resumes-for-job",
+            "analyze_resumes_for_job_stream": "/api/analyze-resumes-for-job/stream",
+            "submit_analyze_resumes": "/api/tasks/analyze-resumes",
+            "submit_analyze_resumes_for_job": "/api/tasks/analyze-resumes-for-job",
+            "task_status": "/api/tasks/{task_id}",
+            "task_result": "/api/tasks/{task_id}/result"
         }
     }
 
@@ -472,235 +747,365 @@ async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "service": "resume-analyzer"}
 
-@app.post("/api/analyze-resumes-for-job")
-async def analyze_resumes_for_job(job_data: Dict[str, Any] = Body(...)):
+@app.get("/api/cache/stats")
+async def cache_stats():
     """
-    Analyze multiple resumes against a job description and required skills.
-    Returns resumes sorted by match score.
+    Hit/miss/eviction counters of the analysis cache. The text cache is only used inside
+    the worker processes, whose counters are not visible here.
+    """
+    return {"analysis": analysis_cache.stats()}
+
+async def score_resume_for_job(index, resume_info, job_description, required_skills, job_id=None, whole_word=False):
+    """
+    Match one applicant resume in the worker pool; returns (index, result entry or None).
+    The file is resolved and read in a thread first, holding a file slot until it is scored.
+    """
+    try:
+        async with file_slot():
+            loaded = await asyncio.to_thread(load_resume_file, resume_info, uploads_dir)
+            result = await run_in_process_pool(analyze_resume_for_job, resume_info, job_description, required_skills,
+                                               uploads_dir, job_id, whole_word, loaded)
+    except Exception as e:
+        print(f"ERROR: worker failed for resume {resume_info}: {str(e)}")
+        result = worker_failure_result(resume_info, f"Processing error: {str(e)}")
+    return index, result
+
+async def rank_resume_for_job(index, resume_info, job_description, required_skills, job_id=None, whole_word=False,
+                              with_terms=False):
+    """Like score_resume_for_job, but returns (index, result entry or None, file info for the job ranking)."""
+    try:
+        async with file_slot():
+            loaded = await asyncio.to_thread(load_resume_file, resume_info, uploads_dir)
+            result, file_info = await run_in_process_pool(match_resume_file, resume_info, job_description,
+                                                          required_skills, uploads_dir, job_id, whole_word,
+                                                          with_terms, loaded)
+    except Exception as e:
+        print(f"ERROR: worker failed for resume {resume_info}: {str(e)}")
+        result, file_info = worker_failure_result(resume_info, f"Processing error: {str(e)}"), None
+    return index, result, file_info
+
+def find_reusable_results(ranking, resume_paths, need_terms=False):
+    """Split a job's resumes into reusable (index, result) pairs and the indexes that need scoring."""
+    reused, pending = [], []
+    for index, resume_info in enumerate(resume_paths):
+        result = ranking.reuse(resume_info, uploads_dir, need_terms)
+        if result is None:
+            pending.append(index)
+        else:
+            reused.append((index, result))
+    return reused, pending
+
+def rank_job_results(results, threshold):
+    """Sort results by match score (highest first) and apply the minimum score threshold."""
+    results.sort(key=lambda x: x["matchScore"], reverse=True)
+    
+    # Filter to only show resumes with match score >= threshold (configurable)
+    filtered_results = [r for r in results if r["matchScore"] >= threshold]
+    
+    # If threshold is 0, show all results
+    if threshold == 0:
+        filtered_results = results
+    return filtered_results
+
+def print_job_summary(total_paths, processed_count, matching_count, threshold):
+    """Log a summary of a job matching run."""
+    print(f"\n{'='*60}")
+    print(f"ANALYSIS SUMMARY")
+    print(f"{'='*60}")
+    print(f"Total resume paths sent: {total_paths}")
+    print(f"Total results processed: {processed_count}")
+    print(f"Results after threshold filter ({threshold}%): {matching_count}")
+    if processed_count == 0:
+        print("⚠️  WARNING: No results were generated!")
+        print("   This could mean:")
+        print("   - Resume files not found")
+        print("   - All resumes failed to process")
+        print("   - Check errors above for details")
+    print(f"{'='*60}\n")
+
+async def match_resumes_for_job(job_data, on_progress=None):
+    """
+    Match the job's resumes and build the /api/analyze-resumes-for-job response.
+    on_progress(completed) is called as resumes finish.
+
+    Match results are stored per jobId: resumes whose files are unchanged since the job
+    was last ranked (with the same description and skills) are reused, and only new or
+    changed ones are scored. "rescore": true scores every resume again.
+
+    "tfidfMatch": true blends a TF-IDF cosine similarity between each resume and the job
+    description into descriptionMatch. The IDF weights come from the job's resumes, so the
+    blend is recomputed over all of them on every call from their stored term counts.
+
+    The response holds one page of the ranked results ("offset", and "limit" for a top-K
+    page; all results by default) plus the counts. "includeAllResults": true adds every
+    result, whatever its score, as "allResults".
     """
     try:
         job_id = job_data.get("jobId")
         job_description = job_data.get("jobDescription", "")
         required_skills = job_data.get("requiredSkills", [])
         resume_paths = job_data.get("resumePaths", [])
+        # Count description words only when they appear as whole words in the resume
+        whole_word = bool(job_data.get("wholeWordMatch", False))
+        use_tfidf = bool(job_data.get("tfidfMatch", False))
+        if use_tfidf and not tfidf_available():
+            print("TF-IDF matching requested but scikit-learn is not installed; using keyword matching")
+            use_tfidf = False
         
         if not job_id:
             return {"error": "Job ID is required"}
         
         if not resume_paths:
             return {"error": "No resume paths provided"}
+
+        try:
+            offset = max(int(job_data.get("offset", 0)), 0)
+            limit = job_data.get("limit")
+            limit = None if limit is None else max(int(limit), 0)
+        except (TypeError, ValueError):
+            return {"error": "offset and limit must be numbers"}
         
-        from utils.resume_parser import extract_text, match_resume_to_job
-        import os
-        
-        results = []
-        uploads_dir = os.path.join(os.path.dirname(__file__), "uploads")
-        
-        for resume_info in resume_paths:
-            try:
-                resume_path = resume_info.get("path") or resume_info.get("resumePath")
-                seeker_email = resume_info.get("seekerEmail", "Unknown")
-                application_id = resume_info.get("applicationId", "")
-                
-                if not resume_path:
-                    continue
-                
-                # Construct full file path
-                # Handle both relative and absolute paths
-                if os.path.isabs(resume_path):
-                    full_path = resume_path
-                else:
-                    full_path = os.path.join(uploads_dir, resume_path)
-                
-                if not os.path.exists(full_path):
-                    print(f"Resume file not found: {full_path}")
-                    # Try alternative paths
-                    alt_paths = [
-                        os.path.join(uploads_dir, os.path.basename(resume_path)),
-                        resume_path,
-                        os.path.join(os.path.dirname(__file__), "uploads", os.path.basename(resume_path))
-                    ]
-                    full_path = None
-                    for alt_path in alt_paths:
-                        if os.path.exists(alt_path):
-                            full_path = alt_path
-                            print(f"Found resume at alternative path: {full_path}")
-                            break
-                    
-                    if not full_path:
-                        print(f"Resume file not found in any location. Tried: {resume_path}, {alt_paths}")
-                        # Still add to results with 0 score so user knows resume is missing
-                        results.append({
-                            "seekerEmail": seeker_email,
-                            "applicationId": application_id,
-                            "resumePath": resume_path,
-                            "matchScore": 0,
-                            "skillsMatch": 0,
-                            "descriptionMatch": 0,
-                            "keywordsMatch": 0,
-                            "matchedSkills": [],
-                            "missingSkills": required_skills if isinstance(required_skills, list) else (required_skills.split(',') if isinstance(required_skills, str) else []),
-                            "resumeFileName": os.path.basename(resume_path),
-                            "error": "Resume file not found"
-                        })
-                        continue
-                
-                # Extract text from resume
-                from io import BytesIO
-                resume_text = None
-                try:
-                    print(f"Attempting to read resume file: {full_path}")
-                    with open(full_path, 'rb') as f:
-                        file_content = f.read()
-                        if len(file_content) == 0:
-                            raise Exception("File is empty")
-                        file_obj = BytesIO(file_content)
-                        file_obj.filename = os.path.basename(resume_path)
-                        
-                        resume_text = extract_text(file_obj)
-                        print(f"Extracted {len(resume_text)} characters from resume")
-                        
-                        if not resume_text or len(resume_text.strip()) < 50:
-                            print(f"Warning: Resume text is too short or empty for {seeker_email} ({len(resume_text) if resume_text else 0} chars)")
-                            # Still process it, might have some content
-                except Exception as extract_error:
-                    print(f"ERROR extracting text from resume {resume_path}: {str(extract_error)}")
-                    import traceback
-                    traceback.print_exc()
-                    # Add to results with error
-                    results.append({
-                        "seekerEmail": seeker_email,
-                        "applicationId": application_id,
-                        "resumePath": resume_path,
-                        "matchScore": 0,
-                        "skillsMatch": 0,
-                        "descriptionMatch": 0,
-                        "keywordsMatch": 0,
-                        "matchedSkills": [],
-                        "missingSkills": required_skills if isinstance(required_skills, list) else (required_skills.split(',') if isinstance(required_skills, str) else []),
-                        "resumeFileName": os.path.basename(resume_path),
-                        "error": f"Failed to extract text: {str(extract_error)}"
-                    })
-                    continue
-                
-                if not resume_text:
-                    print(f"ERROR: No text extracted from resume for {seeker_email}")
-                    results.append({
-                        "seekerEmail": seeker_email,
-                        "applicationId": application_id,
-                        "resumePath": resume_path,
-                        "matchScore": 0,
-                        "skillsMatch": 0,
-                        "descriptionMatch": 0,
-                        "keywordsMatch": 0,
-                        "matchedSkills": [],
-                        "missingSkills": required_skills if isinstance(required_skills, list) else (required_skills.split(',') if isinstance(required_skills, str) else []),
-                        "resumeFileName": os.path.basename(resume_path),
-                        "error": "No text extracted from resume"
-                    })
-                    continue
-                
-                # Match resume to job
-                print(f"\n=== Analyzing resume for {seeker_email} ===")
-                print(f"Resume text length: {len(resume_text)}")
-                print(f"Job description length: {len(job_description)}")
-                print(f"Required skills: {required_skills}")
-                
-                try:
-                    match_result = match_resume_to_job(resume_text, job_description, required_skills)
-                    print(f"Match score: {match_result['total_score']}%")
-                    print(f"  - Skills match: {match_result['skills_match']}/50")
-                    print(f"  - Description match: {match_result['description_match']}/30")
-                    print(f"  - Keywords match: {match_result['keywords_match']}/20")
-                    print(f"Matched skills: {match_result.get('matched_skills', [])}")
-                    print(f"Missing skills: {match_result.get('missing_skills', [])}")
-                except Exception as match_error:
-                    print(f"ERROR matching resume to job: {str(match_error)}")
-                    import traceback
-                    traceback.print_exc()
-                    match_result = {
-                        "total_score": 0,
-                        "skills_match": 0,
-                        "description_match": 0,
-                        "keywords_match": 0,
-                        "matched_skills": [],
-                        "missing_skills": required_skills if isinstance(required_skills, list) else (required_skills.split(',') if isinstance(required_skills, str) else [])
-                    }
-                
-                results.append({
-                    "seekerEmail": seeker_email,
-                    "applicationId": application_id,
-                    "resumePath": resume_path,
-                    "matchScore": match_result["total_score"],
-                    "skillsMatch": match_result["skills_match"],
-                    "descriptionMatch": match_result["description_match"],
-                    "keywordsMatch": match_result["keywords_match"],
-                    "matchedSkills": match_result.get("matched_skills", []),
-                    "missingSkills": match_result.get("missing_skills", []),
-                    "resumeFileName": os.path.basename(resume_path)
-                })
-                print(f"✓ Successfully analyzed resume for {seeker_email}: {match_result['total_score']}% match\n")
-                
-            except Exception as e:
-                print(f"ERROR processing resume {resume_path}: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                # Add to results with error so user knows something went wrong
-                results.append({
-                    "seekerEmail": seeker_email,
-                    "applicationId": application_id,
-                    "resumePath": resume_path,
-                    "matchScore": 0,
-                    "skillsMatch": 0,
-                    "descriptionMatch": 0,
-                    "keywordsMatch": 0,
-                    "matchedSkills": [],
-                    "missingSkills": [],
-                    "resumeFileName": os.path.basename(resume_path) if resume_path else "unknown",
-                    "error": f"Processing error: {str(e)}"
-                })
-                continue
-        
-        # Sort by match score (highest first)
-        results.sort(key=lambda x: x["matchScore"], reverse=True)
+        version = ranking_version(job_description, required_skills, whole_word)
+        if job_data.get("rescore", False):
+            ranking = JobRanking(job_id, version)
+        else:
+            ranking = await asyncio.to_thread(JobRanking.load, job_id, version)
+        reused, pending = await asyncio.to_thread(find_reusable_results, ranking, resume_paths, use_tfidf)
+        progress = on_progress
+        if on_progress is not None and reused:
+            on_progress(len(reused))
+            progress = lambda done: on_progress(len(reused) + done)
+
+        # Spread resume processing over the worker pool so the event loop stays free
+        outcomes = await gather_with_progress([
+            rank_resume_for_job(index, resume_paths[index], job_description, required_skills, job_id, whole_word,
+                                use_tfidf)
+            for index in pending
+        ], progress)
+        for index, result, file_info in outcomes:
+            if result is not None:
+                ranking.record(resume_paths[index], result, file_info)
+        await asyncio.to_thread(ranking.save, resume_paths)
+        scored = [(index, result) for index, result, _ in outcomes if result is not None]
+        if use_tfidf:
+            pairs = reused + scored
+            rows = [ranking.terms(resume_paths[index]) for index, _ in pairs]
+            pairs = await asyncio.to_thread(apply_tfidf_match, job_description, pairs, rows)
+            reused, scored = pairs[:len(reused)], pairs[len(reused):]
         
-        # Filter to only show resumes with match score >= threshold (configurable)
         threshold = job_data.get("minMatchScore", 0)
-        filtered_results = [r for r in results if r["matchScore"] >= threshold]
+        page, matching_count = select_rankings(reused + scored, threshold, offset, limit)
+        processed_count = len(reused) + len(scored)
+        print_job_summary(len(resume_paths), processed_count, matching_count, threshold)
         
-        # If threshold is 0, show all results
-        if threshold == 0:
-            filtered_results = results
-        
-        print(f"\n{'='*60}")
-        print(f"ANALYSIS SUMMARY")
-        print(f"{'='*60}")
-        print(f"Total resume paths sent: {len(resume_paths)}")
-        print(f"Total results processed: {len(results)}")
-        print(f"Results after threshold filter ({threshold}%): {len(filtered_results)}")
-        if len(results) == 0:
-            print("⚠️  WARNING: No results were generated!")
-            print("   This could mean:")
-            print("   - Resume files not found")
-            print("   - All resumes failed to process")
-            print("   - Check errors above for details")
-        print(f"{'='*60}\n")
-        
-        return {
+        response = {
             "success": True,
             "jobId": job_id,
             "totalResumes": len(resume_paths),
-            "matchingResumes": len(filtered_results),
-            "results": filtered_results,
-            "allResults": results,  # Include all for reference
+            "matchingResumes": matching_count,
+            "results": page,
+            "offset": offset,
+            "limit": limit,
             "threshold": threshold,
-            "processedCount": len(results)
+            "processedCount": processed_count,
+            "reusedCount": len(reused),
+            "matchMode": "tfidf" if use_tfidf else "keyword"
         }
+        if job_data.get("includeAllResults", False):
+            response["allResults"] = merge_rankings(reused, scored)
+        return response
         
     except Exception as e:
         print(f"Error analyzing resumes for job: {str(e)}")
         return {"error": f"Failed to analyze resumes: {str(e)}"}
 
+@app.post("/api/analyze-resumes-for-job")
+async def analyze_resumes_for_job(job_data: Dict[str, Any] = Body(...)):
+    """
+    Analyze multiple resumes against a job description and required skills.
+    Returns resumes sorted by match score.
+    """
+    return await match_resumes_for_job(job_data)
+
+# Candidates returned by /api/candidates/search unless "limit" asks for a different number
+SEARCH_DEFAULT_LIMIT = 10
+SEARCH_MAX_LIMIT = 100
+
+@app.post("/api/candidates/search")
+async def search_candidates(query: Dict[str, Any] = Body(...)):
+    """
+    Find the best candidates for a job among all resumes in uploads/.
+    An inverted index over the uploads (updated with new and changed files on every
+    search) ranks the resumes by required skills and description words; only the top
+    "limit" of them are matched in full, and the results are sorted by match score.
+    """
+    job_description = query.get("jobDescription", "")
+    required_skills = query.get("requiredSkills", [])
+    whole_word = bool(query.get("wholeWordMatch", False))
+    try:
+        limit = int(query.get("limit", SEARCH_DEFAULT_LIMIT))
+    except (TypeError, ValueError):
+        return {"error": "limit must be a number"}
+    limit = min(max(limit, 1), SEARCH_MAX_LIMIT)
+
+    if not required_skills and not job_description:
+        return {"error": "Required skills or a job description are required"}
+
+    try:
+        index = await get_resume_index(uploads_dir)
+        candidates, candidate_count = index.search(required_skills, job_description, limit)
+        outcomes = await asyncio.gather(*(
+            score_resume_for_job(rank, {"path": name}, job_description, required_skills, None, whole_word)
+            for rank, (name, _) in enumerate(candidates)
+        ))
+        results = []
+        for (_, result), (_, index_score) in zip(outcomes, candidates):
+            results.append({**result, "indexScore": round(index_score, 1)})
+        # Full match score first; the index order breaks ties
+        results.sort(key=lambda x: x["matchScore"], reverse=True)
+        return {
+            "success": True,
+            "indexedResumes": len(index.files),
+            "candidateCount": candidate_count,
+            "limit": limit,
+            "results": results
+        }
+    except Exception as e:
+        print(f"Error searching candidates: {str(e)}")
+        return {"error": f"Candidate search failed: {str(e)}"}
+
+def format_stream_frame(event, payload, stream_format):
+    """Serialize one streamed frame as an NDJSON line or a server-sent event."""
+    if stream_format == "sse":
+        return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+    return json.dumps({"type": event, **payload}) + "\n"
+
+@app.post("/api/analyze-resumes-for-job/stream")
+async def analyze_resumes_for_job_stream(job_data: Dict[str, Any] = Body(...), format: str = "ndjson"):
+    """
+    Streaming variant of /api/analyze-resumes-for-job.
+    Emits each resume's match record as soon as it is scored (NDJSON lines, or
+    server-sent events with ?format=sse), then a final ranked summary frame that
+    references the streamed records by index instead of repeating them.
+    Matching is always keyword based: "tfidfMatch" needs every resume before any score.
+    """
+    job_id = job_data.get("jobId")
+    job_description = job_data.get("jobDescription", "")
+    required_skills = job_data.get("requiredSkills", [])
+    resume_paths = job_data.get("resumePaths", [])
+    whole_word = bool(job_data.get("wholeWordMatch", False))
+    threshold = job_data.get("minMatchScore", 0)
+    stream_format = "sse" if format == "sse" else "ndjson"
+    media_type = "text/event-stream" if stream_format == "sse" else "application/x-ndjson"
+
+    if not job_id:
+        return {"error": "Job ID is required"}
+
+    if not resume_paths:
+        return {"error": "No resume paths provided"}
+
+    async def frames():
+        tasks = [
+            asyncio.ensure_future(score_resume_for_job(index, resume_info, job_description, required_skills, job_id, whole_word))
+            for index, resume_info in enumerate(resume_paths)
+        ]
+        # Only the fields needed for the final ranking are kept in memory
+        ranking = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, result = await next_done
+                if result is None:
+                    continue
+                ranking.append({
+                    "index": index,
+                    "applicationId": result["applicationId"],
+                    "matchScore": result["matchScore"]
+                })
+                yield format_stream_frame("result", {"index": index, "result": result}, stream_format)
+
+            # Ties keep the original submission order, matching the non-streaming endpoint
+            ranking.sort(key=lambda x: x["index"])
+            filtered_ranking = rank_job_results(ranking, threshold)
+            print_job_summary(len(resume_paths), len(ranking), len(filtered_ranking), threshold)
+            yield format_stream_frame("summary", {
+                "success": True,
+                "jobId": job_id,
+                "totalResumes": len(resume_paths),
+                "matchingResumes": len(filtered_ranking),
+                "threshold": threshold,
+                "processedCount": len(ranking),
+                "ranking": filtered_ranking
+            }, stream_format)
+        except Exception as e:
+            print(f"Error streaming resume analysis for job: {str(e)}")
+            yield format_stream_frame("error", {"error": f"Failed to analyze resumes: {str(e)}"}, stream_format)
+        finally:
+            # Client went away or an error occurred: drop work that has not started yet
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(frames(), media_type=media_type)
+
+def task_links(task_id):
+    """Status and result URLs for a background task."""
+    return {
+        "statusUrl": f"/api/tasks/{task_id}",
+        "resultUrl": f"/api/tasks/{task_id}/result"
+    }
+
+@app.post("/api/tasks/analyze-resumes")
+async def submit_analyze_resumes(files: List[UploadFile] = File(...)):
+    """
+    Background variant of /api/analyze-resumes. The files are read during the request,
+    then a task id is returned immediately while the analysis runs on the worker pool.
+    """
+    try:
+        entries, errors = await read_bulk_uploads(files)
+        task_id = submit_task(
+            "analyze-resumes", len(entries),
+            lambda on_progress: analyze_bulk_entries(entries, errors, on_progress)
+        )
+        return {"success": True, "taskId": task_id, "status": "queued", **task_links(task_id)}
+    except Exception as e:
+        print(f"Error submitting bulk resume analysis: {str(e)}")
+        return {"error": f"Bulk resume analysis failed: {str(e)}"}
+
+@app.post("/api/tasks/analyze-resumes-for-job")
+async def submit_analyze_resumes_for_job(job_data: Dict[str, Any] = Body(...)):
+    """Background variant of /api/analyze-resumes-for-job; returns a task id immediately."""
+    if not job_data.get("jobId"):
+        return {"error": "Job ID is required"}
+
+    resume_paths = job_data.get("resumePaths", [])
+    if not resume_paths:
+        return {"error": "No resume paths provided"}
+
+    task_id = submit_task(
+        "analyze-resumes-for-job", len(resume_paths),
+        lambda on_progress: match_resumes_for_job(job_data, on_progress)
+    )
+    return {"success": True, "taskId": task_id, "status": "queued", **task_links(task_id)}
+
+@app.get("/api/tasks/{task_id}")
+async def get_task_status(task_id: str):
+    """Status and progress (completed of total resumes) of a background task."""
+    task = get_task(task_id)
+    if task is None:
+        return {"error": "Task not found"}
+    return {"success": True, **task_status(task)}
+
+@app.get("/api/tasks/{task_id}/result")
+async def get_task_result(task_id: str):
+    """Result of a finished background task (the same response as the synchronous endpoint)."""
+    task = get_task(task_id)
+    if task is None:
+        return {"error": "Task not found"}
+    if task["status"] in ("queued", "running"):
+        return {**task_status(task), "error": "Task is not finished yet"}
+    if task["status"] != "completed":
+        return {**task_status(task), "error": task["error"] or f"Task {task['status']}"}
+    return task["result"]
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="127.0.0.1", port=8000)
\ No newline at end of file
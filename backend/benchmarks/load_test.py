@@ -0,0 +1,121 @@
+"""
+Load test for /api/analyze-resume.
+
+Measures the latency of cheap requests (/health and a cached resume upload) first on an
+idle server, then while a number of clients keep uploading uncached resumes. With the
+parsing work off the event loop, the cheap requests' p99 should stay roughly flat, and
+uploads beyond the configured queue get 503 responses instead of piling up.
+
+Start the server first (python app.py), then run from the backend directory:
+    python benchmarks/load_test.py --heavy 16 --duration 20
+"""
+import argparse
+import glob
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Every upload uses the same name so the single-upload restriction never rejects it
+UPLOAD_NAME = "load-test-resume.pdf"
+
+
+def request(url, data=None, content_type=None):
+    """Send a request and return (status code, seconds taken)."""
+    headers = {"Content-Type": content_type} if content_type else {}
+    req = urllib.request.Request(url, data=data, headers=headers, method="POST" if data is not None else "GET")
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=120) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    return status, time.perf_counter() - started
+
+
+def upload(base_url, content):
+    """POST a resume to /api/analyze-resume as multipart form data."""
+    boundary = uuid.uuid4().hex
+    body = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{UPLOAD_NAME}"\r\n'
+        "Content-Type: application/pdf\r\n\r\n"
+    ).encode() + content + f"\r\n--{boundary}--\r\n".encode()
+    return request(f"{base_url}/api/analyze-resume", body, f"multipart/form-data; boundary={boundary}")
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))]
+
+
+def probe(base_url, cached_content, stop, latencies):
+    """Alternate /health and cached-upload requests until stop is set."""
+    while not stop.is_set():
+        latencies["health"].append(request(f"{base_url}/health")[1])
+        latencies["cached"].append(upload(base_url, cached_content)[1])
+
+
+def heavy_client(base_url, content, stop, statuses):
+    """Keep uploading resumes that miss the cache until stop is set."""
+    while not stop.is_set():
+        # A PDF comment after %%EOF makes the content (and cache key) unique
+        unique = content + f"\n%{uuid.uuid4().hex}\n".encode()
+        status, _ = upload(base_url, unique)
+        statuses.append(status)
+        if status == 503:
+            time.sleep(0.5)
+
+
+def run_phase(base_url, resume, heavy, duration):
+    stop = threading.Event()
+    latencies = {"health": [], "cached": []}
+    statuses = []
+    with ThreadPoolExecutor(max_workers=heavy + 1) as executor:
+        executor.submit(probe, base_url, resume, stop, latencies)
+        for _ in range(heavy):
+            executor.submit(heavy_client, base_url, resume, stop, statuses)
+        time.sleep(duration)
+        stop.set()
+    return latencies, statuses
+
+
+def report(label, latencies, statuses):
+    print(f"\n{label}")
+    for name, values in latencies.items():
+        print(f"  {name:<8} n={len(values):<5} p50={percentile(values, 50) * 1000:8.1f}ms "
+              f"p99={percentile(values, 99) * 1000:8.1f}ms")
+    if statuses:
+        counts = {status: statuses.count(status) for status in sorted(set(statuses))}
+        print(f"  heavy uploads by status: {counts}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--file", help="PDF resume to upload (defaults to one from uploads/)")
+    parser.add_argument("--heavy", type=int, default=8, help="concurrent clients uploading uncached resumes")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per phase")
+    args = parser.parse_args()
+
+    path = args.file or sorted(glob.glob(os.path.join(BACKEND_DIR, "uploads", "*.pdf")))[0]
+    with open(path, "rb") as f:
+        resume = f.read()
+
+    request(f"{args.url}/api/clear-upload", b"")
+    # Warm the analysis cache for the cached-hit probe
+    upload(args.url, resume)
+
+    report("Idle server", *run_phase(args.url, resume, 0, args.duration))
+    report(f"Under load ({args.heavy} heavy clients)", *run_phase(args.url, resume, args.heavy, args.duration))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark of the PDF text extraction backends.
+
+Extracts every PDF in uploads/ with each installed backend (see utils/pdf_extractors.py)
+and prints the median time per file, plus how many characters came out after the same
+normalization extract_text applies.
+
+Run from the backend directory:
+    python benchmarks/pdf_backends.py [--runs 5]
+"""
+import argparse
+import glob
+import os
+import re
+import statistics
+import sys
+import time
+import unicodedata
+from io import BytesIO
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.pdf_extractors import PDF_BACKENDS, backend_available, read_pdf_text
+
+UPLOADS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "uploads")
+
+
+def normalized_length(text):
+    return len(re.sub(r'\s+', ' ', unicodedata.normalize("NFKD", text).strip()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare PDF extraction backends on uploads/")
+    parser.add_argument("--runs", type=int, default=5, help="extractions per file and backend")
+    args = parser.parse_args()
+
+    files = sorted(glob.glob(os.path.join(UPLOADS_DIR, "*.pdf")))
+    if not files:
+        print(f"No PDF files in {UPLOADS_DIR}")
+        return
+    contents = [(os.path.basename(path), open(path, "rb").read()) for path in files]
+
+    backends = [backend for name, backend in PDF_BACKENDS.items() if backend_available(name)]
+    missing = [name for name in PDF_BACKENDS if not backend_available(name)]
+    if missing:
+        print(f"Not installed (skipped): {', '.join(missing)}")
+
+    print(f"{len(contents)} files, {args.runs} runs each\n")
+    print(f"{'backend':<12} {'median ms/file':>15} {'total ms':>10} {'chars':>10}")
+    for backend in backends:
+        medians = []
+        chars = 0
+        for _, data in contents:
+            times = []
+            for _ in range(args.runs):
+                started = time.perf_counter()
+                text = read_pdf_text(BytesIO(data), backend)
+                times.append(time.perf_counter() - started)
+            medians.append(statistics.median(times))
+            chars += normalized_length(text)
+        print(f"{backend.name:<12} {statistics.median(medians) * 1000:>15.1f} "
+              f"{sum(medians) * 1000:>10.1f} {chars:>10}")
+
+
+if __name__ == "__main__":
+    main()
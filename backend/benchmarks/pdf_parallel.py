@@ -0,0 +1,74 @@
+"""
+Benchmark of page-parallel PDF extraction.
+
+Builds a long PDF by concatenating the sample PDFs in uploads/, then times reading it
+in one process against read_pdf_text_parallel with different numbers of worker
+processes. The parallel time should drop roughly with the number of cores.
+
+Run from the backend directory:
+    python benchmarks/pdf_parallel.py [--pages 40] [--workers 2 4 8]
+"""
+import argparse
+import asyncio
+import glob
+import os
+import sys
+import time
+from io import BytesIO
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyPDF2 import PdfReader, PdfWriter
+
+from utils import workers
+from utils.pdf_extractors import get_pdf_backend, pdf_page_count, read_pdf_text, read_pdf_text_parallel
+
+UPLOADS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "uploads")
+
+
+def build_long_pdf(pages):
+    """A PDF of at least `pages` pages made from the sample resumes."""
+    writer = PdfWriter()
+    sources = [PdfReader(path) for path in sorted(glob.glob(os.path.join(UPLOADS_DIR, "*.pdf")))]
+    while len(writer.pages) < pages:
+        for page in sources[len(writer.pages) % len(sources)].pages:
+            writer.add_page(page)
+    output = BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+async def time_parallel(data):
+    # Start the worker processes before timing
+    await workers.run_in_process_pool(len, "")
+    started = time.perf_counter()
+    text = await read_pdf_text_parallel(data)
+    return text, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time serial vs page-parallel PDF extraction")
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8])
+    args = parser.parse_args()
+
+    data = build_long_pdf(args.pages)
+    os.environ["RESUME_PDF_PARALLEL_PAGES"] = "1"
+    print(f"{pdf_page_count(data)} pages, backend {get_pdf_backend().name}, {os.cpu_count()} cores\n")
+
+    started = time.perf_counter()
+    serial_text = read_pdf_text(BytesIO(data))
+    serial = time.perf_counter() - started
+    print(f"{'serial':<12} {serial * 1000:>8.0f} ms")
+
+    for count in args.workers:
+        os.environ["RESUME_WORKERS"] = str(count)
+        workers.shutdown_process_pool()
+        text, seconds = asyncio.run(time_parallel(data))
+        same = "same text" if text == serial_text else "TEXT DIFFERS"
+        print(f"{count:>2} workers   {seconds * 1000:>8.0f} ms  {serial / seconds:4.1f}x  {same}")
+    workers.shutdown_process_pool()
+
+
+if __name__ == "__main__":
+    main()
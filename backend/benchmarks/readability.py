@@ -0,0 +1,82 @@
+"""
+Benchmark of the readability score against textstat.
+
+Extracts every resume in uploads/ and times textstat.flesch_reading_ease(text) against
+utils.readability.flesch_reading_ease(text.split()), printing the median time per resume
+and the largest difference between the two scores (which should be 0 with pyphen
+installed). textstat memoizes whole-text results, so its caches are cleared before every
+call; the syllable memo of utils.readability is shown both cold and warm.
+
+Run from the backend directory:
+    python benchmarks/readability.py [--runs 20]
+"""
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+from io import BytesIO
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import textstat
+
+from utils.readability import flesch_reading_ease, get_hyphenator, token_syllables
+from utils.resume_parser import extract_text
+
+UPLOADS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "uploads")
+
+
+def load_texts():
+    texts = []
+    for path in sorted(glob.glob(os.path.join(UPLOADS_DIR, "*"))):
+        if not path.lower().endswith((".pdf", ".docx")):
+            continue
+        file_obj = BytesIO(open(path, "rb").read())
+        file_obj.filename = path
+        texts.append(extract_text(file_obj))
+    return texts
+
+
+def median_ms(function, texts, runs, before=None):
+    """Median milliseconds per resume of function(text) over all texts."""
+    times = []
+    for _ in range(runs):
+        for text in texts:
+            if before:
+                before()
+            started = time.perf_counter()
+            function(text)
+            times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare readability scoring with textstat")
+    parser.add_argument("--runs", type=int, default=20, help="passes over the resumes")
+    args = parser.parse_args()
+
+    texts = load_texts()
+    if not texts:
+        print(f"No resumes in {UPLOADS_DIR}")
+        return
+    if get_hyphenator() is None:
+        print("pyphen not installed: syllables are estimated, scores will differ from textstat")
+
+    differences = [abs(textstat.flesch_reading_ease(text) - flesch_reading_ease(text.split())) for text in texts]
+    print(f"{len(texts)} resumes, max difference from textstat {max(differences):.2f}\n")
+
+    print(f"{'method':<26} {'median ms/resume':>17}")
+    textstat_ms = median_ms(textstat.flesch_reading_ease, texts, args.runs,
+                            before=textstat.textstat._cache_clear)
+    print(f"{'textstat':<26} {textstat_ms:>17.3f}")
+    cold_ms = median_ms(lambda text: flesch_reading_ease(text.split()), texts, args.runs,
+                        before=token_syllables.cache_clear)
+    print(f"{'readability (cold memo)':<26} {cold_ms:>17.3f}  {textstat_ms / cold_ms:4.1f}x")
+    warm_ms = median_ms(lambda text: flesch_reading_ease(text.split()), texts, args.runs)
+    print(f"{'readability (warm memo)':<26} {warm_ms:>17.3f}  {textstat_ms / warm_ms:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
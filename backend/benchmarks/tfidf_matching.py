@@ -0,0 +1,77 @@
+"""
+Benchmark of TF-IDF description matching over a large pool of resumes.
+
+Builds --resumes synthetic resumes by sampling words from the resumes in uploads/, computes
+their term counts once (as match_resume_file does per resume when "tfidfMatch" is on) and
+times utils.tfidf_matching.description_similarities: stacking the stored rows into a sparse
+matrix, fitting IDF on them and the single matrix-vector product against the description.
+
+Run from the backend directory:
+    python benchmarks/tfidf_matching.py [--resumes 10000] [--runs 5]
+"""
+import argparse
+import glob
+import os
+import random
+import statistics
+import sys
+import time
+from io import BytesIO
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.resume_parser import extract_text
+from utils.tfidf_matching import description_similarities, term_counts, tfidf_available
+
+UPLOADS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "uploads")
+
+JOB_DESCRIPTION = (
+    "We are looking for a backend engineer with strong Python and SQL experience to build "
+    "REST APIs and microservices on AWS. Experience with Docker, Kubernetes, CI/CD pipelines "
+    "and agile teams is a plus."
+)
+
+
+def load_words():
+    words = []
+    for path in sorted(glob.glob(os.path.join(UPLOADS_DIR, "*"))):
+        if not path.lower().endswith((".pdf", ".docx")):
+            continue
+        file_obj = BytesIO(open(path, "rb").read())
+        file_obj.filename = path
+        words.extend(extract_text(file_obj).split())
+    return words
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time TF-IDF ranking of a large resume pool")
+    parser.add_argument("--resumes", type=int, default=10000, help="synthetic resumes to rank")
+    parser.add_argument("--words", type=int, default=500, help="words per synthetic resume")
+    parser.add_argument("--runs", type=int, default=5, help="timed rankings")
+    args = parser.parse_args()
+
+    if not tfidf_available():
+        print("scikit-learn is not installed")
+        return
+    words = load_words()
+    if not words:
+        print(f"No resumes in {UPLOADS_DIR}")
+        return
+
+    rng = random.Random(0)
+    started = time.perf_counter()
+    rows = [term_counts(" ".join(rng.choices(words, k=args.words))) for _ in range(args.resumes)]
+    print(f"{args.resumes} resumes of {args.words} words: term counts in {time.perf_counter() - started:.2f}s "
+          f"(once per resume, stored with its ranking)")
+
+    times = []
+    for _ in range(args.runs):
+        started = time.perf_counter()
+        similarities = description_similarities(JOB_DESCRIPTION, rows)
+        times.append(time.perf_counter() - started)
+    print(f"ranking: median {statistics.median(times) * 1000:.0f} ms over {args.runs} runs, "
+          f"best similarity {similarities.max():.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# Runtime cache directory shared by the analysis and text caches
+cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
+os.makedirs(cache_dir, exist_ok=True)
+
+# Disk usage is checked against the size limit once every this many writes
+TRIM_EVERY = 50
+
+# Keys the JSON backend accepts: plain file name tokens (content hashes, digests, names)
+JSON_KEY_RE = re.compile(r'[A-Za-z0-9_-]+')
+
+# A SQLite hit only records its access time once the recorded one is this many seconds
+# old, so most hits are plain reads instead of writes queued on the database lock
+TOUCH_INTERVAL = 3600
+
+
+def _env_number(name, default):
+    value = os.environ.get(name, "").strip()
+    try:
+        return float(value) if value else default
+    except ValueError:
+        print(f"Invalid {name} value {value!r}, using {default}")
+        return default
+
+
+class JsonFileBackend:
+    """One JSON file per key in a directory (the original cache layout)."""
+
+    def __init__(self, directory, indent=None):
+        self.directory = directory
+        self.indent = indent
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        # Keys become file names, so anything that could leave the directory is refused
+        if not isinstance(key, str) or not JSON_KEY_RE.fullmatch(key):
+            raise ValueError(f"Invalid cache key {key!r}")
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        """Return (serialized value, stored_at) or None."""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read(), os.path.getmtime(path)
+        except FileNotFoundError:
+            return None
+
+    def set(self, key, data):
+        path = self._path(key)
+        if self.indent is not None:
+            data = json.dumps(json.loads(data), indent=self.indent)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        # Atomic rename so concurrent readers never see a half-written entry
+        os.replace(tmp_path, path)
+
+    def delete(self, key):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def trim(self, max_bytes):
+        """Delete the least recently written entries until the directory fits in max_bytes."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, name in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+            evicted += 1
+        return evicted
+
+
+class SqliteBackend:
+    """Entries in one table of a SQLite database, shared safely by threads and worker processes."""
+
+    def __init__(self, path, table):
+        self.path = path
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+
+    def _connection(self):
+        # Connections must not cross a fork, so each worker process opens its own
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+                "stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {self.table}_accessed ON {self.table} (accessed_at)")
+            conn.commit()
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def get(self, key):
+        """Return (serialized value, stored_at) or None."""
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(f"SELECT value, stored_at, accessed_at FROM {self.table} WHERE key = ?",
+                               (key,)).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if now - row[2] > TOUCH_INTERVAL:
+                conn.execute(f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key))
+                conn.commit()
+        return row[0], row[1]
+
+    def set(self, key, data):
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, size, stored_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, data, len(data), now, now),
+            )
+            conn.commit()
+
+    def delete(self, key):
+        with self._lock:
+            conn = self._connection()
+            conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            conn.commit()
+
+    def trim(self, max_bytes):
+        """Delete the least recently used entries until the table fits in max_bytes."""
+        with self._lock:
+            conn = self._connection()
+            total = conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table}").fetchone()[0]
+            if total <= max_bytes:
+                return 0
+            evict = []
+            for key, size in conn.execute(f"SELECT key, size FROM {self.table} ORDER BY accessed_at"):
+                if total <= max_bytes:
+                    break
+                evict.append((key,))
+                total -= size
+            conn.executemany(f"DELETE FROM {self.table} WHERE key = ?", evict)
+            conn.commit()
+        return len(evict)
+
+
+class CacheStore:
+    """
+    Two-tier JSON value cache: an in-memory LRU in front of a disk backend.
+
+    Entries older than ttl seconds are dropped on lookup, and the disk tier is trimmed
+    back to max_bytes (least recently used first). An optional read-only fallback
+    backend is consulted on a miss, and its hits are copied into the main backend, so
+    existing caches keep working after switching backends.
+    """
+
+    def __init__(self, backend, memory_items=256, max_bytes=None, ttl=None, fallback=None):
+        self.backend = backend
+        self.memory_items = memory_items
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.fallback = fallback
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "memory_evictions": 0,
+                         "errors": 0}
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] += amount
+
+    def _expired(self, stored_at):
+        return self.ttl is not None and time.time() - stored_at > self.ttl
+
+    def _remember(self, key, data, stored_at):
+        with self._lock:
+            self._memory[key] = (data, stored_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+                self.counters["memory_evictions"] += 1
+
+    def get(self, key):
+        """Return the cached value for key, or None."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+        if entry is not None and not self._expired(entry[1]):
+            self._count("memory_hits")
+            # Values are kept serialized so callers always get their own copy
+            return json.loads(entry[0])
+
+        try:
+            entry = self.backend.get(key)
+            if entry is None and self.fallback is not None:
+                entry = self.fallback.get(key)
+                if entry is not None and not self._expired(entry[1]):
+                    self.backend.set(key, entry[0])
+            if entry is not None and self._expired(entry[1]):
+                self.delete(key)
+                self._count("evictions")
+                entry = None
+            if entry is None:
+                self._count("misses")
+                return None
+            value = json.loads(entry[0])
+        except Exception as e:
+            print(f"Error loading cache entry {key}: {e}")
+            self._count("errors")
+            return None
+
+        self._count("disk_hits")
+        self._remember(key, entry[0], entry[1])
+        return value
+
+    def set(self, key, value):
+        """Store a JSON-serializable value under key."""
+        try:
+            data = json.dumps(value, separators=(',', ':'))
+            self.backend.set(key, data)
+        except Exception as e:
+            print(f"Error saving cache entry {key}: {e}")
+            self._count("errors")
+            return
+        self._remember(key, data, time.time())
+
+        with self._lock:
+            self._writes += 1
+            trim_now = self.max_bytes is not None and self._writes % TRIM_EVERY == 1
+        if trim_now:
+            try:
+                self._count("evictions", self.backend.trim(self.max_bytes))
+            except Exception as e:
+                print(f"Error trimming cache: {e}")
+
+    def delete(self, key):
+        with self._lock:
+            self._memory.pop(key, None)
+        self.backend.delete(key)
+
+    def stats(self):
+        """Hit/miss/eviction counters for this process."""
+        with self._lock:
+            return {**self.counters, "memory_entries": len(self._memory)}
+
+
+def create_cache_store(name, json_dir=None, json_indent=None, fallback=None, memory_items=256):
+    """
+    Build the cache store for one cache (e.g. "analysis" or "text") from the environment:
+    RESUME_CACHE_BACKEND (sqlite or json), RESUME_CACHE_MAX_MB and RESUME_CACHE_TTL_DAYS.
+    The json backend keeps one file per entry in json_dir (default cache/<name>).
+    """
+    backend_name = os.environ.get("RESUME_CACHE_BACKEND", "sqlite").strip().lower()
+    max_mb = _env_number("RESUME_CACHE_MAX_MB", 512)
+    ttl_days = _env_number("RESUME_CACHE_TTL_DAYS", 90)
+    max_bytes = int(max_mb * 1024 * 1024) if max_mb > 0 else None
+    ttl = ttl_days * 24 * 60 * 60 if ttl_days > 0 else None
+
+    if backend_name == "json":
+        backend = JsonFileBackend(json_dir or os.path.join(cache_dir, name), indent=json_indent)
+        fallback = None
+    else:
+        if backend_name != "sqlite":
+            print(f"Unknown RESUME_CACHE_BACKEND {backend_name!r}, using sqlite")
+        backend = SqliteBackend(os.path.join(cache_dir, "cache.sqlite"), name)
+    return CacheStore(backend, memory_items=memory_items, max_bytes=max_bytes, ttl=ttl, fallback=fallback)
@@ -0,0 +1,83 @@
+import posixpath
+import zipfile
+from xml.etree.ElementTree import iterparse
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+RELS_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+OFFICE_DOCUMENT_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+
+BODY = W_NS + "body"
+PARAGRAPH = W_NS + "p"
+RUN = W_NS + "r"
+HYPERLINK = W_NS + "hyperlink"
+BREAK = W_NS + "br"
+TYPE_ATTR = W_NS + "type"
+
+# Text equivalents of run content, as python-docx's Run.text produces them
+# (w:br is handled separately: only line breaks become "\n")
+RUN_CONTENT_TEXT = {
+    W_NS + "tab": "\t",
+    W_NS + "ptab": "\t",
+    W_NS + "cr": "\n",
+    W_NS + "noBreakHyphen": "-",
+}
+TEXT = W_NS + "t"
+
+
+def main_document_path(archive):
+    """Path of the main document part inside the package (normally word/document.xml)."""
+    try:
+        with archive.open("_rels/.rels") as rels:
+            for _, element in iterparse(rels):
+                if element.tag == RELS_NS + "Relationship" and element.get("Type") == OFFICE_DOCUMENT_REL:
+                    return posixpath.normpath(element.get("Target").lstrip("/"))
+    except KeyError:
+        pass
+    return "word/document.xml"
+
+
+def iter_docx_paragraphs(file_obj):
+    """
+    Yield the text of each top-level body paragraph of a .docx file, streaming the
+    document XML instead of building python-docx's object model.
+
+    Matches python-docx's `para.text` for `Document(file).paragraphs`: only w:p elements
+    directly under w:body (not tables), and only w:r and w:hyperlink/w:r runs directly
+    inside them, with tabs, line breaks and non-breaking hyphens translated the same way.
+    """
+    with zipfile.ZipFile(file_obj) as archive:
+        with archive.open(main_document_path(archive)) as document:
+            path = []
+            parts = []
+            for event, element in iterparse(document, events=("start", "end")):
+                if event == "start":
+                    path.append(element.tag)
+                    continue
+
+                path.pop()
+                depth = len(path)
+                tag = element.tag
+                # path is now the element's ancestors: document, body, p, [hyperlink,] r
+                if depth >= 4 and path[1] == BODY and path[2] == PARAGRAPH and path[-1] == RUN and (
+                        depth == 4 or (depth == 5 and path[3] == HYPERLINK)):
+                    if tag == TEXT:
+                        parts.append(element.text or "")
+                    elif tag == BREAK:
+                        if element.get(TYPE_ATTR, "textWrapping") == "textWrapping":
+                            parts.append("\n")
+                    elif tag in RUN_CONTENT_TEXT:
+                        parts.append(RUN_CONTENT_TEXT[tag])
+                elif depth == 2 and path[1] == BODY:
+                    if tag == PARAGRAPH:
+                        yield "".join(parts)
+                    parts = []
+                    # Finished body blocks are not needed again
+                    element.clear()
+
+
+def read_docx_text(file_obj):
+    """
+    Text of a .docx file: paragraphs joined with newlines. Blank paragraphs are kept as
+    empty lines so normalization can see paragraph breaks; they vanish from the flat text.
+    """
+    return "\n".join(iter_docx_paragraphs(file_obj))
@@ -0,0 +1,233 @@
+import os
+import traceback
+
+from utils.resume_parser import match_resume_to_profile
+from utils.job_profile import get_job_profile
+from utils.text_cache import extract_text_cached, get_content_hash
+from utils.tfidf_matching import term_counts
+from utils.upload_index import get_upload_index
+
+
+def normalize_required_skills(required_skills):
+    """Return required skills as a list, accepting a list or a comma-separated string."""
+    if isinstance(required_skills, list):
+        return required_skills
+    if isinstance(required_skills, str):
+        return required_skills.split(',')
+    return []
+
+
+def _error_result(seeker_email, application_id, resume_path, missing_skills, error):
+    """Build a zero-score result entry so the recruiter can see what went wrong."""
+    return {
+        "seekerEmail": seeker_email,
+        "applicationId": application_id,
+        "resumePath": resume_path,
+        "matchScore": 0,
+        "skillsMatch": 0,
+        "descriptionMatch": 0,
+        "keywordsMatch": 0,
+        "matchedSkills": [],
+        "missingSkills": missing_skills,
+        "resumeFileName": os.path.basename(resume_path) if resume_path else "unknown",
+        "error": error
+    }
+
+
+def worker_failure_result(resume_info, error):
+    """Build an error entry for a resume whose worker task failed outright."""
+    info = resume_info if isinstance(resume_info, dict) else {}
+    return _error_result(info.get("seekerEmail", "Unknown"), info.get("applicationId", ""),
+                         info.get("path") or info.get("resumePath"), [], error)
+
+
+def resolve_resume_path(resume_path, uploads_dir):
+    """
+    Find a resume on disk, trying the uploads directory and basename variants.
+    Files in the uploads directory are looked up in its index instead of stat'ing each path.
+    """
+    index = get_upload_index(uploads_dir)
+    # Handle both relative and absolute paths
+    if os.path.isabs(resume_path):
+        full_path = resume_path
+    else:
+        full_path = os.path.join(uploads_dir, resume_path)
+
+    if index.exists(full_path):
+        return full_path
+
+    print(f"Resume file not found: {full_path}")
+    # Try alternative paths
+    alt_paths = [
+        os.path.join(uploads_dir, os.path.basename(resume_path)),
+        resume_path,
+    ]
+    for alt_path in alt_paths:
+        if index.exists(alt_path):
+            print(f"Found resume at alternative path: {alt_path}")
+            return alt_path
+
+    print(f"Resume file not found in any location. Tried: {resume_path}, {alt_paths}")
+    return None
+
+
+def read_resume_file(full_path):
+    """A resume file's content with the size and modification time it had when read."""
+    with open(full_path, 'rb') as f:
+        content = f.read()
+        file_stat = os.fstat(f.fileno())
+    return {"path": full_path, "content": content, "size": file_stat.st_size, "mtime": file_stat.st_mtime_ns}
+
+
+def load_resume_file(resume_info, uploads_dir):
+    """
+    Resolve and read an applicant's resume ahead of matching it, or None when it has no
+    path, cannot be found or cannot be read (the worker then reports why).
+    """
+    if not isinstance(resume_info, dict):
+        return None
+    resume_path = resume_info.get("path") or resume_info.get("resumePath")
+    full_path = resolve_resume_path(resume_path, uploads_dir) if resume_path else None
+    if not full_path:
+        return None
+    try:
+        return read_resume_file(full_path)
+    except OSError as e:
+        print(f"ERROR reading resume file {full_path}: {str(e)}")
+        return None
+
+
+def match_result_entry(seeker_email, application_id, resume_path, match):
+    """Build the result entry of a matched resume from its match fields."""
+    return {
+        "seekerEmail": seeker_email,
+        "applicationId": application_id,
+        "resumePath": resume_path,
+        "matchScore": match["matchScore"],
+        "skillsMatch": match["skillsMatch"],
+        "descriptionMatch": match["descriptionMatch"],
+        "keywordsMatch": match["keywordsMatch"],
+        "matchedSkills": match["matchedSkills"],
+        "missingSkills": match["missingSkills"],
+        "resumeFileName": os.path.basename(resume_path)
+    }
+
+
+def analyze_resume_for_job(resume_info, job_description, required_skills, uploads_dir, job_id=None, whole_word=False,
+                           loaded=None):
+    """
+    Resolve, extract and match a single applicant resume against a job.
+    Runs inside a worker process; returns a result entry, or None if the entry has no path.
+    The job profile is built once per worker process and reused for later resumes of the job.
+    loaded is the file as read by load_resume_file, if it was read ahead.
+    """
+    return match_resume_file(resume_info, job_description, required_skills, uploads_dir, job_id, whole_word,
+                             loaded=loaded)[0]
+
+
+def match_resume_file(resume_info, job_description, required_skills, uploads_dir, job_id=None, whole_word=False,
+                      with_terms=False, loaded=None):
+    """
+    Like analyze_resume_for_job, but returns (result entry, file_info). file_info has the
+    size, modification time and content hash of the resume file as it was read, or is
+    None when the resume could not be matched. with_terms adds the resume's hashed term
+    counts ("terms") for TF-IDF matching.
+    """
+    resume_path = None
+    seeker_email = "Unknown"
+    application_id = ""
+    try:
+        resume_path = resume_info.get("path") or resume_info.get("resumePath")
+        seeker_email = resume_info.get("seekerEmail", "Unknown")
+        application_id = resume_info.get("applicationId", "")
+
+        if not resume_path:
+            return None, None
+
+        full_path = loaded["path"] if loaded else resolve_resume_path(resume_path, uploads_dir)
+        if not full_path:
+            # Still add to results with 0 score so user knows resume is missing
+            return _error_result(seeker_email, application_id, resume_path,
+                                 normalize_required_skills(required_skills),
+                                 "Resume file not found"), None
+
+        # Extract text from resume
+        resume_text = None
+        resume_sections = None
+        try:
+            if not loaded:
+                print(f"Attempting to read resume file: {full_path}")
+                loaded = read_resume_file(full_path)
+            file_content = loaded["content"]
+            if len(file_content) == 0:
+                raise Exception("File is empty")
+            file_hash = get_content_hash(file_content)
+            resume_text, resume_sections, _ = extract_text_cached(file_content, os.path.basename(resume_path), file_hash)
+            print(f"Extracted {len(resume_text)} characters from resume")
+
+            if not resume_text or len(resume_text.strip()) < 50:
+                print(f"Warning: Resume text is too short or empty for {seeker_email} ({len(resume_text) if resume_text else 0} chars)")
+                # Still process it, might have some content
+        except Exception as extract_error:
+            print(f"ERROR extracting text from resume {resume_path}: {str(extract_error)}")
+            traceback.print_exc()
+            return _error_result(seeker_email, application_id, resume_path,
+                                 normalize_required_skills(required_skills),
+                                 f"Failed to extract text: {str(extract_error)}"), None
+
+        if not resume_text:
+            print(f"ERROR: No text extracted from resume for {seeker_email}")
+            return _error_result(seeker_email, application_id, resume_path,
+                                 normalize_required_skills(required_skills),
+                                 "No text extracted from resume"), None
+
+        # Match resume to job
+        print(f"\n=== Analyzing resume for {seeker_email} ===")
+        print(f"Resume text length: {len(resume_text)}")
+        print(f"Job description length: {len(job_description)}")
+        print(f"Required skills: {required_skills}")
+
+        try:
+            profile = get_job_profile(job_description, required_skills, job_id, whole_word)
+            match_result = match_resume_to_profile(resume_text, profile, resume_sections)
+            print(f"Match score: {match_result['total_score']}%")
+            print(f"  - Skills match: {match_result['skills_match']}/50")
+            print(f"  - Description match: {match_result['description_match']}/30")
+            print(f"  - Keywords match: {match_result['keywords_match']}/20")
+            print(f"Matched skills: {match_result.get('matched_skills', [])}")
+            print(f"Missing skills: {match_result.get('missing_skills', [])}")
+        except Exception as match_error:
+            print(f"ERROR matching resume to job: {str(match_error)}")
+            traceback.print_exc()
+            file_hash = None
+            match_result = {
+                "total_score": 0,
+                "skills_match": 0,
+                "description_match": 0,
+                "keywords_match": 0,
+                "matched_skills": [],
+                "missing_skills": normalize_required_skills(required_skills)
+            }
+
+        print(f"✓ Successfully analyzed resume for {seeker_email}: {match_result['total_score']}% match\n")
+        result = match_result_entry(seeker_email, application_id, resume_path, {
+            "matchScore": match_result["total_score"],
+            "skillsMatch": match_result["skills_match"],
+            "descriptionMatch": match_result["description_match"],
+            "keywordsMatch": match_result["keywords_match"],
+            "matchedSkills": match_result.get("matched_skills", []),
+            "missingSkills": match_result.get("missing_skills", []),
+        })
+        file_info = None
+        if file_hash is not None:
+            file_info = {"size": loaded["size"], "mtime": loaded["mtime"], "hash": file_hash}
+            if with_terms:
+                file_info["terms"] = term_counts(resume_text)
+        return result, file_info
+
+    except Exception as e:
+        print(f"ERROR processing resume {resume_path}: {str(e)}")
+        traceback.print_exc()
+        # Add to results with error so user knows something went wrong
+        return _error_result(seeker_email, application_id, resume_path, [],
+                             f"Processing error: {str(e)}"), None
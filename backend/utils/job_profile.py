@@ -0,0 +1,111 @@
+import hashlib
+import json
+import re
+from collections import Counter, OrderedDict
+
+from utils.keyword_matcher import KeywordMatcher
+
+# Common technical terms used by job matching
+JOB_TECH_KEYWORDS = [
+    "python", "javascript", "react", "sql", "java", "node", "html", "css",
+    "data analysis", "machine learning", "statistics", "excel", "power bi", "tableau",
+    "project management", "agile", "scrum", "git", "docker", "aws", "azure",
+    "database", "api", "rest", "json", "xml", "linux", "windows", "cloud"
+]
+
+# Common stop words removed from job descriptions
+STOP_WORDS = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'}
+
+DESC_WORD_RE = re.compile(r'\b\w{3,}\b')
+RESUME_WORD_RE = re.compile(r'\w+')
+
+# Profiles kept per process, most recently used last
+PROFILE_CACHE_SIZE = 64
+_profile_cache = OrderedDict()
+
+
+def normalize_skills(required_skills):
+    """Lowercase and strip required skills given as a list or comma-separated string."""
+    if isinstance(required_skills, str):
+        return [skill.strip().lower() for skill in required_skills.split(',')]
+    if isinstance(required_skills, list):
+        return [str(skill).strip().lower() for skill in required_skills]
+    return []
+
+
+def resume_vocabulary(resume_lower):
+    """Set of whole words in a lowercased resume, for O(1) description word lookups."""
+    return set(RESUME_WORD_RE.findall(resume_lower))
+
+
+class JobProfile:
+    """
+    Job-side matching data (normalized skills, description keywords and the keyword
+    automaton), built once per job and reused for every resume in a batch.
+
+    Description words are matched against the resume in one of two ways:
+    - substring (default): a word counts if it appears anywhere in the resume, exactly
+      as the original `word in resume_lower` check, so scores are unchanged. The
+      unique words are part of the keyword automaton, so the resume is scanned once.
+    - whole_word: a word counts only if the resume contains it as a complete word
+      (looked up in the resume's word set). Hits are a subset of substring hits, so
+      description_match can only drop; "java" no longer matches "javascript". On the
+      sample uploads this lowers description_match by 0-6 of its 30 points.
+    """
+
+    def __init__(self, job_description, required_skills, whole_word=False):
+        self.required_skills = normalize_skills(required_skills)
+        # Words of each skill that count towards a partial match
+        self.skill_words = {
+            skill: [word for word in skill.split() if len(word) > 3]
+            for skill in self.required_skills
+        }
+
+        # Meaningful description words (3+ characters, not stop words)
+        job_desc_lower = job_description.lower() if job_description else ""
+        desc_words = [word for word in DESC_WORD_RE.findall(job_desc_lower) if word not in STOP_WORDS]
+        # Repeated words keep their weight, but each unique word is looked up once
+        self.desc_word_counts = Counter(desc_words)
+        self.desc_word_total = len(desc_words)
+        self.whole_word = whole_word
+
+        dictionaries = {
+            "skills": [skill for skill in self.required_skills if skill],
+            "skill_words": [word for words in self.skill_words.values() for word in words],
+            "tech": JOB_TECH_KEYWORDS,
+        }
+        if not whole_word:
+            dictionaries["desc"] = list(self.desc_word_counts)
+        self.matcher = KeywordMatcher(dictionaries)
+        self.fingerprint = job_fingerprint(job_description, required_skills, whole_word)
+
+    def description_hits(self, resume_hits, resume_lower):
+        """Number of description words (with repeats) found in the resume."""
+        if self.whole_word:
+            found = resume_vocabulary(resume_lower)
+        else:
+            found = resume_hits["desc"]
+        return sum(count for word, count in self.desc_word_counts.items() if word in found)
+
+
+def job_fingerprint(job_description, required_skills, whole_word=False):
+    """Hash of the job inputs, used to notice when a cached job has been edited."""
+    payload = json.dumps([job_description or "", normalize_skills(required_skills), whole_word])
+    return hashlib.md5(payload.encode('utf-8')).hexdigest()
+
+
+def get_job_profile(job_description, required_skills, job_id=None, whole_word=False):
+    """
+    Return a JobProfile for the job, reusing a cached one when the job is unchanged.
+    Profiles are cached by job_id when given, otherwise by the job inputs.
+    """
+    fingerprint = job_fingerprint(job_description, required_skills, whole_word)
+    key = job_id or fingerprint
+    profile = _profile_cache.get(key)
+    if profile is None or profile.fingerprint != fingerprint:
+        profile = JobProfile(job_description, required_skills, whole_word)
+        _profile_cache[key] = profile
+    _profile_cache.move_to_end(key)
+    while len(_profile_cache) > PROFILE_CACHE_SIZE:
+        _profile_cache.popitem(last=False)
+    return profile
@@ -0,0 +1,130 @@
+import hashlib
+import heapq
+import os
+
+from utils.cache_store import create_cache_store
+from utils.job_matching import match_result_entry, resolve_resume_path
+from utils.job_profile import job_fingerprint
+from utils.pdf_extractors import get_pdf_backend
+from utils.resume_parser import PARSER_VERSION
+
+# Per-job match breakdowns, keyed by jobId, so re-ranking only scores new or changed resumes
+ranking_store = create_cache_store("rankings", memory_items=64)
+
+# Bump whenever match_resume_to_profile scores change, so stored breakdowns are recomputed
+RANKING_VERSION = 1
+
+MATCH_FIELDS = ("matchScore", "skillsMatch", "descriptionMatch", "keywordsMatch", "matchedSkills", "missingSkills")
+
+
+def ranking_version(job_description, required_skills, whole_word=False):
+    """
+    Version of a job's stored ranking: the job profile inputs plus everything else a match
+    breakdown depends on (matching rules, parser and PDF backend). A different version
+    means every resume has to be scored again.
+    """
+    fingerprint = job_fingerprint(job_description, required_skills, whole_word)
+    return f"{RANKING_VERSION}:{PARSER_VERSION}:{get_pdf_backend().name}:{fingerprint}"
+
+
+def ranking_key(job_id):
+    """Cache key of a job's ranking: a digest of the client-supplied jobId, safe as a file name."""
+    return hashlib.md5(str(job_id).encode("utf-8")).hexdigest()
+
+
+def resume_key(resume_info):
+    """Key of an applicant's resume in a job ranking (the path the application sent)."""
+    if not isinstance(resume_info, dict):
+        return None
+    return resume_info.get("path") or resume_info.get("resumePath")
+
+
+def rank_key(item):
+    """Sort key of an (index, result) pair: highest score first, ties in submission order."""
+    index, result = item
+    return -result["matchScore"], index
+
+
+class JobRanking:
+    """
+    Stored match breakdowns of one job's resumes.
+
+    Each entry records the resume file's size, modification time and content hash with
+    the match fields of its result (and its hashed term counts when it was scored for
+    TF-IDF matching). A resume whose file is unchanged is reused without reading it;
+    everything else is scored and recorded again.
+    """
+
+    def __init__(self, job_id, version, entries=None):
+        self.job_id = job_id
+        self.version = version
+        self.entries = entries or {}
+
+    @classmethod
+    def load(cls, job_id, version):
+        """The job's stored ranking, or an empty one if it is missing or was built for another version."""
+        stored = ranking_store.get(ranking_key(job_id))
+        if stored is None or stored.get("version") != version:
+            return cls(job_id, version)
+        return cls(job_id, version, stored["entries"])
+
+    def save(self, resume_paths):
+        """Store the ranking, keeping only the resumes that are still part of the job."""
+        keys = {resume_key(resume_info) for resume_info in resume_paths}
+        entries = {key: entry for key, entry in self.entries.items() if key in keys}
+        ranking_store.set(ranking_key(self.job_id), {"version": self.version, "entries": entries})
+
+    def reuse(self, resume_info, uploads_dir, need_terms=False):
+        """
+        The result entry for an unchanged resume, or None if it has to be scored (also when
+        need_terms asks for term counts the entry does not have).
+        """
+        key = resume_key(resume_info)
+        entry = self.entries.get(key) if key else None
+        if entry is None or (need_terms and "terms" not in entry):
+            return None
+        full_path = resolve_resume_path(key, uploads_dir)
+        try:
+            stat = os.stat(full_path) if full_path else None
+        except OSError:
+            stat = None
+        if stat is None or stat.st_size != entry["size"] or stat.st_mtime_ns != entry["mtime"]:
+            return None
+        return match_result_entry(resume_info.get("seekerEmail", "Unknown"), resume_info.get("applicationId", ""),
+                                  key, entry["match"])
+
+    def terms(self, resume_info):
+        """The stored term counts of a resume, or None."""
+        entry = self.entries.get(resume_key(resume_info))
+        return entry.get("terms") if entry else None
+
+    def record(self, resume_info, result, file_info):
+        """Remember a freshly scored resume. Failed resumes (file_info None) are retried next time."""
+        key = resume_key(resume_info)
+        if not key or file_info is None or "error" in result:
+            self.entries.pop(key, None)
+            return
+        self.entries[key] = {**file_info, "match": {field: result[field] for field in MATCH_FIELDS}}
+
+
+def select_rankings(pairs, threshold, offset=0, limit=None):
+    """
+    One page of the ranked results of (index, result) pairs: those scoring at least
+    threshold, ordered by rank_key, skipping offset and keeping limit (all when None).
+    A limited page is taken with a heap instead of sorting every result. Returns
+    (page, number of results at or above the threshold).
+    """
+    matching = [item for item in pairs if item[1]["matchScore"] >= threshold]
+    if limit is None:
+        page = sorted(matching, key=rank_key)[offset:]
+    else:
+        page = heapq.nsmallest(offset + limit, matching, key=rank_key)[offset:]
+    return [result for _, result in page], len(matching)
+
+
+def merge_rankings(reused, scored):
+    """
+    Merge reused and freshly scored (index, result) pairs into one ranked list of results,
+    ordered like rank_job_results orders a full rescoring.
+    """
+    return [result for _, result in heapq.merge(sorted(reused, key=rank_key), sorted(scored, key=rank_key), key=rank_key)]
@@ -0,0 +1,73 @@
+from collections import deque
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over several named keyword dictionaries.
+
+    scan() walks the text once and reports which keywords of every dictionary occur
+    in it (case-insensitive substring semantics, same as `keyword in text.lower()`),
+    so the cost is O(len(text) + matches) regardless of how many keywords there are.
+    """
+
+    def __init__(self, dictionaries):
+        self.names = list(dictionaries)
+        goto = [{}]
+        outputs = [[]]
+
+        # Build the keyword trie
+        for name, keywords in dictionaries.items():
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if not keyword:
+                    continue
+                state = 0
+                for ch in keyword:
+                    next_state = goto[state].get(ch)
+                    if next_state is None:
+                        next_state = len(goto)
+                        goto[state][ch] = next_state
+                        goto.append({})
+                        outputs.append([])
+                    state = next_state
+                if (name, keyword) not in outputs[state]:
+                    outputs[state].append((name, keyword))
+
+        # Breadth-first pass: failure links, merged outputs and a complete transition
+        # table, so scanning never has to follow failure links
+        alphabet = {ch for transitions in goto for ch in transitions}
+        fail = [0] * len(goto)
+        delta = [None] * len(goto)
+        delta[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            transitions = {}
+            for ch in alphabet:
+                child = goto[state].get(ch)
+                if child is not None:
+                    fail[child] = delta[fail[state]].get(ch, 0)
+                    transitions[ch] = child
+                    queue.append(child)
+                else:
+                    target = delta[fail[state]].get(ch, 0)
+                    if target:
+                        transitions[ch] = target
+            delta[state] = transitions
+
+        self._delta = delta
+        self._outputs = [tuple(out) for out in outputs]
+
+    def scan(self, text):
+        """Return {dictionary name: set of its keywords found in text}."""
+        hits = {name: set() for name in self.names}
+        delta = self._delta
+        outputs = self._outputs
+        state = 0
+        for ch in text.lower():
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                for name, keyword in outputs[state]:
+                    hits[name].add(keyword)
+        return hits
@@ -0,0 +1,227 @@
+import asyncio
+import importlib.util
+import os
+from io import BytesIO
+from itertools import islice
+
+from PyPDF2 import PdfReader
+
+# Limits on how much of a PDF is read; resumes are far below both
+PDF_MAX_PAGES = 50
+PDF_MAX_CHARS = 200000
+# Default page count from which a PDF's pages are extracted in parallel
+PDF_PARALLEL_MIN_PAGES = 20
+# PDFs smaller than this many bytes per threshold page are not even opened to count their
+# pages (resume pages run 40-100 KB; a smaller file is read serially, which is still correct)
+PDF_PARALLEL_MIN_BYTES_PER_PAGE = 16 * 1024
+
+
+class PyPDF2Backend:
+    """Pure-Python fallback that is always installed. Pages are joined without a separator, as before."""
+
+    name = "pypdf2"
+    module = "PyPDF2"
+    page_separator = ""
+
+    def open(self, file_obj):
+        return PdfReader(file_obj)
+
+    def page_count(self, doc):
+        return len(doc.pages)
+
+    def page_texts(self, doc, start=0, stop=None):
+        count = len(doc.pages)
+        for index in range(start, count if stop is None else min(stop, count)):
+            yield doc.pages[index].extract_text() or ""
+
+    def close(self, doc):
+        pass
+
+
+class PdfiumBackend:
+    """PDFium (the Chrome PDF engine) through pypdfium2; several times faster than PyPDF2."""
+
+    name = "pypdfium2"
+    module = "pypdfium2"
+    page_separator = "\n"
+
+    def open(self, file_obj):
+        import pypdfium2
+        return pypdfium2.PdfDocument(file_obj)
+
+    def page_count(self, doc):
+        return len(doc)
+
+    def page_texts(self, doc, start=0, stop=None):
+        count = len(doc)
+        for index in range(start, count if stop is None else min(stop, count)):
+            page = doc[index]
+            textpage = page.get_textpage()
+            try:
+                yield textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+
+    def close(self, doc):
+        doc.close()
+
+
+class PdfminerBackend:
+    """pdfminer.six without layout analysis (laparams=None), the cheapest pdfminer mode."""
+
+    name = "pdfminer"
+    module = "pdfminer"
+    page_separator = "\n"
+
+    def open(self, file_obj):
+        from pdfminer.pdfdocument import PDFDocument
+        from pdfminer.pdfparser import PDFParser
+        return PDFDocument(PDFParser(file_obj))
+
+    def page_count(self, doc):
+        from pdfminer.pdfpage import PDFPage
+        return sum(1 for _ in PDFPage.create_pages(doc))
+
+    def page_texts(self, doc, start=0, stop=None):
+        from io import StringIO
+        from pdfminer.converter import TextConverter
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+
+        resources = PDFResourceManager()
+        output = StringIO()
+        device = TextConverter(resources, output, laparams=None)
+        interpreter = PDFPageInterpreter(resources, device)
+        try:
+            for page in islice(PDFPage.create_pages(doc), start, stop):
+                interpreter.process_page(page)
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+        finally:
+            device.close()
+
+    def close(self, doc):
+        pass
+
+
+PDF_BACKENDS = {backend.name: backend for backend in (PdfiumBackend(), PdfminerBackend(), PyPDF2Backend())}
+# Backends tried by RESUME_PDF_BACKEND=auto, fastest first. pdfminer is slower than
+# PyPDF2 on typical resumes, so it is only used when asked for explicitly.
+AUTO_BACKENDS = ("pypdfium2", "pypdf2")
+
+_pdf_backend = None
+
+
+def backend_available(name):
+    """True if the backend's library is installed."""
+    return importlib.util.find_spec(PDF_BACKENDS[name].module) is not None
+
+
+def get_pdf_backend():
+    """
+    Return the PDF backend chosen by RESUME_PDF_BACKEND (auto, pypdfium2, pdfminer or
+    pypdf2). auto, and any backend that is not installed, fall back to the fastest one available.
+    """
+    global _pdf_backend
+    if _pdf_backend is None:
+        choice = os.environ.get("RESUME_PDF_BACKEND", "auto").strip().lower()
+        if choice in PDF_BACKENDS and backend_available(choice):
+            _pdf_backend = PDF_BACKENDS[choice]
+        else:
+            if choice != "auto":
+                print(f"PDF backend {choice!r} is not available, choosing automatically")
+            _pdf_backend = next(PDF_BACKENDS[name] for name in AUTO_BACKENDS if backend_available(name))
+        print(f"Using PDF backend: {_pdf_backend.name}")
+    return _pdf_backend
+
+
+def iter_pdf_pages(file_obj, backend=None, max_pages=PDF_MAX_PAGES):
+    """Yield the text of each page in turn, up to max_pages."""
+    backend = backend or get_pdf_backend()
+    doc = backend.open(file_obj)
+    try:
+        yield from backend.page_texts(doc, 0, max_pages)
+    finally:
+        backend.close(doc)
+
+
+def join_pdf_pages(page_texts, backend, max_chars=PDF_MAX_CHARS):
+    """Join page texts in order, stopping once max_chars have been collected."""
+    parts = []
+    total = 0
+    for page_text in page_texts:
+        if parts:
+            parts.append(backend.page_separator)
+        parts.append(page_text)
+        total += len(page_text)
+        if total >= max_chars:
+            break
+    return "".join(parts)[:max_chars]
+
+
+def read_pdf_text(file_obj, backend=None, max_pages=PDF_MAX_PAGES, max_chars=PDF_MAX_CHARS):
+    """Raw text of a PDF, read page by page and stopping once max_chars have been collected."""
+    backend = backend or get_pdf_backend()
+    return join_pdf_pages(iter_pdf_pages(file_obj, backend, max_pages), backend, max_chars)
+
+
+def pdf_page_count(data, backend_name=None):
+    """Number of pages in a PDF given as bytes (run in worker processes)."""
+    backend = PDF_BACKENDS[backend_name] if backend_name else get_pdf_backend()
+    doc = backend.open(BytesIO(data))
+    try:
+        return backend.page_count(doc)
+    finally:
+        backend.close(doc)
+
+
+def extract_page_range(data, start, stop, backend_name=None):
+    """Text of pages [start, stop) of a PDF given as bytes (run in worker processes)."""
+    backend = PDF_BACKENDS[backend_name] if backend_name else get_pdf_backend()
+    doc = backend.open(BytesIO(data))
+    try:
+        return list(backend.page_texts(doc, start, stop))
+    finally:
+        backend.close(doc)
+
+
+def get_parallel_min_pages():
+    """Page count from which PDFs are split across workers (RESUME_PDF_PARALLEL_PAGES, 0 disables)."""
+    value = os.environ.get("RESUME_PDF_PARALLEL_PAGES", "").strip()
+    try:
+        return int(value) if value else PDF_PARALLEL_MIN_PAGES
+    except ValueError:
+        print(f"Invalid RESUME_PDF_PARALLEL_PAGES value {value!r}, using {PDF_PARALLEL_MIN_PAGES}")
+        return PDF_PARALLEL_MIN_PAGES
+
+
+async def read_pdf_text_parallel(data, max_pages=PDF_MAX_PAGES, max_chars=PDF_MAX_CHARS):
+    """
+    Raw text of a long PDF, with its pages split into one contiguous range per worker
+    process and reassembled in page order. Returns None for PDFs below the page
+    threshold (or when disabled), which are cheaper to read in a single process. Files
+    too small to have that many pages skip the page count, so an ordinary resume costs
+    no extra trip to the worker pool.
+    """
+    from utils.workers import get_worker_count, run_in_process_pool
+
+    min_pages = get_parallel_min_pages()
+    workers = get_worker_count()
+    if min_pages <= 0 or workers < 2 or len(data) < min_pages * PDF_PARALLEL_MIN_BYTES_PER_PAGE:
+        return None
+    backend = get_pdf_backend()
+    # PDFium is not thread-safe, so even the page count is read in a worker process
+    page_count = min(await run_in_process_pool(pdf_page_count, data, backend.name), max_pages)
+    if page_count < min_pages:
+        return None
+
+    parts = min(workers, page_count)
+    bounds = [page_count * n // parts for n in range(parts + 1)]
+    ranges = await asyncio.gather(*(
+        run_in_process_pool(extract_page_range, data, start, stop, backend.name)
+        for start, stop in zip(bounds, bounds[1:])
+    ))
+    print(f"Extracted {page_count} PDF pages in {parts} parallel ranges")
+    return join_pdf_pages((page_text for page_texts in ranges for page_text in page_texts), backend, max_chars)
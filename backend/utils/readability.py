@@ -0,0 +1,103 @@
+import math
+import re
+from functools import lru_cache
+
+try:
+    # Same hyphenation dictionaries textstat counts syllables with (textstat depends on it)
+    import pyphen
+except ImportError:
+    pyphen = None
+
+# Flesch reading ease constants for English
+FRE_BASE = 206.835
+FRE_SENTENCE_LENGTH = 1.015
+FRE_SYLLABLES_PER_WORD = 84.6
+
+PUNCTUATION_RE = re.compile(r'[^\w\s]')
+WORD_CHAR_RE = re.compile(r'\w')
+SENTENCE_END_RE = re.compile(r'[.!?]')
+VOWEL_GROUP_RE = re.compile(r'[aeiouy]+')
+
+_hyphenator = None
+
+
+def get_hyphenator():
+    """Return the shared pyphen dictionary, or None when pyphen is not installed."""
+    global _hyphenator
+    if _hyphenator is None and pyphen is not None:
+        _hyphenator = pyphen.Pyphen(lang="en_US")
+    return _hyphenator
+
+
+@lru_cache(maxsize=65536)
+def token_syllables(token):
+    """
+    Syllables in a whitespace-separated token, counted like textstat: lowercased, with
+    punctuation removed, one more than the number of hyphenation points. 0 means the token
+    is not a word (no letters or digits).
+    """
+    word = PUNCTUATION_RE.sub('', token.lower())
+    if not word:
+        return 0
+    hyphenator = get_hyphenator()
+    if hyphenator is not None:
+        return len(hyphenator.positions(word)) + 1
+    # Without pyphen, approximate with the number of vowel groups
+    groups = len(VOWEL_GROUP_RE.findall(word))
+    if groups > 1 and word.endswith('e') and not word.endswith(('le', 'ee')):
+        groups -= 1
+    return max(groups, 1)
+
+
+def legacy_round(number, points=0):
+    """Round half away from zero, as textstat does."""
+    scale = 10 ** points
+    return math.floor(number * scale + math.copysign(0.5, number)) / scale
+
+
+def text_statistics(words):
+    """
+    Count (words, syllables, sentences) over the whitespace-separated tokens of a text.
+
+    One pass over the tokens reproduces textstat's counts: words are tokens with a letter
+    or digit, and sentences are the runs of text between '.', '!' and '?' that hold more
+    than two words (at least 1).
+    """
+    word_count = 0
+    syllables = 0
+    sentences = 0
+    sentence_words = 0
+    for token in words:
+        count = token_syllables(token)
+        if count:
+            word_count += 1
+            syllables += count
+        if '.' not in token and '!' not in token and '?' not in token:
+            if count:
+                sentence_words += 1
+            continue
+        # A sentence can end inside a token ("React.js" is two sentences to textstat)
+        for i, fragment in enumerate(SENTENCE_END_RE.split(token)):
+            if i:
+                if sentence_words > 2:
+                    sentences += 1
+                sentence_words = 0
+            if WORD_CHAR_RE.search(fragment):
+                sentence_words += 1
+    if sentence_words > 2:
+        sentences += 1
+    return word_count, syllables, max(sentences, 1)
+
+
+def flesch_reading_ease(words):
+    """
+    Flesch reading ease of a text given its whitespace-separated tokens (text.split()).
+
+    Matches textstat.flesch_reading_ease(text) including its rounding, without running
+    textstat's own tokenization; syllable counts are memoized per token across calls.
+    """
+    word_count, syllables, sentences = text_statistics(words)
+    sentence_length = legacy_round(word_count / sentences, 1)
+    syllables_per_word = legacy_round(syllables / word_count, 1) if word_count else 0.0
+    return legacy_round(FRE_BASE - FRE_SENTENCE_LENGTH * sentence_length
+                        - FRE_SYLLABLES_PER_WORD * syllables_per_word, 2)
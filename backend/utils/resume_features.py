@@ -0,0 +1,110 @@
+import re
+from dataclasses import dataclass, field
+
+from utils.keyword_matcher import KeywordMatcher
+from utils.readability import flesch_reading_ease
+from utils.text_normalizer import count_bullet_lines
+
+# Keyword dictionaries used by the professionalism score
+TECH_KEYWORDS = [
+    "python", "javascript", "react", "sql", "management", "node", "java",
+    "docker", "kubernetes", "aws", "azure", "gcp", "machine learning",
+    "data analysis", "project management", "agile", "scrum", "git",
+    "rest api", "microservices", "devops", "ci/cd", "tensorflow", "pytorch"
+]
+ACHIEVEMENT_WORDS = ['achieved', 'increased', 'improved', 'reduced', 'developed', 'created', 'managed', 'led', 'implemented']
+ACTION_VERBS = [
+    'achieved', 'accomplished', 'administered', 'analyzed', 'assisted', 'built', 'collaborated',
+    'created', 'delivered', 'designed', 'developed', 'executed', 'facilitated', 'generated',
+    'implemented', 'improved', 'increased', 'initiated', 'launched', 'led', 'managed',
+    'optimized', 'organized', 'performed', 'planned', 'produced', 'reduced', 'resolved',
+    'streamlined', 'supervised', 'transformed', 'utilized'
+]
+ACHIEVEMENT_WORD_SET = frozenset(ACHIEVEMENT_WORDS)
+
+# One automaton finds all scoring keywords in a single scan of the resume
+SCORE_KEYWORD_MATCHER = KeywordMatcher({
+    "tech": TECH_KEYWORDS,
+    "achievement": ACHIEVEMENT_WORDS,
+    "action": ACTION_VERBS,
+})
+
+# Bullet lines of text that still has its line breaks (same rule as count_bullet_lines)
+BULLET_LINE_RE = re.compile(r'^[^\S\n]*(?:•|[-*](?:[^\S\n]|$))', re.MULTILINE)
+PROPER_NAME_RE = re.compile(r'\b[A-Z][a-z]+\s+[A-Z][a-z]+')
+PROPER_NOUN_PAIR_RE = re.compile(r'[A-Z][a-z]+\s+[A-Z][a-z]+')
+YEAR_RE = re.compile(r'\d{4}')
+PHONE_RE = re.compile(r'\(\d{3}\)\s*\d{3}-\d{4}|\d{3}-\d{3}-\d{4}')
+NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?%?\b')
+QUANTIFIED_PHRASE_RE = re.compile(r'\b(?:increased|decreased|reduced|improved|saved|generated|managed|led|supervised|trained|developed|created|built|delivered|achieved|accomplished|grew|expanded|optimized|streamlined|enhanced|boosted|raised|lowered|cut|eliminated|reduced|minimized|maximized|doubled|tripled|quadrupled|halved|by\s+\d+%?|\d+x|\d+\s+times|\d+\s+fold)\b', re.IGNORECASE)
+
+
+@dataclass
+class ResumeFeatures:
+    """Text features of one resume, read by the score, its issues and analysis_details."""
+    word_count: int
+    bullet_count: int
+    readability: float
+    grammar_errors: int
+    # Distinct dictionary keywords found anywhere in the text (substring matches)
+    tech_keywords: set = field(default_factory=set)
+    achievement_keywords: set = field(default_factory=set)
+    action_verbs: set = field(default_factory=set)
+    # Whole words of the text that are achievement words, repeats included
+    achievement_word_count: int = 0
+    has_proper_name: bool = False
+    proper_noun_pairs: int = 0
+    has_year: bool = False
+    has_at_sign: bool = False
+    has_phone: bool = False
+    number_count: int = 0
+    quantified_phrase_count: int = 0
+
+
+def count_grammar_errors(doc):
+    """Sentences of a spaCy doc that start lowercase, plus long ones without end punctuation."""
+    errors = 0
+    for sent in doc.sents:
+        stripped = sent.text.strip()
+        if stripped and not stripped[0].isupper():
+            errors += 1
+        if len(stripped) > 30 and not stripped.endswith(('.', '!', '?')):
+            errors += 1
+    return errors
+
+
+def extract_resume_features(text, doc=None, line_index=None):
+    """
+    Extract every scoring feature of a resume's text in one pass per kind of feature:
+    one split into word tokens (word count, readability, achievement words), one
+    keyword automaton scan, one pass over the line index for bullets and a fixed set
+    of regex scans.
+
+    doc is the spaCy doc used for grammar errors (0 without it). line_index is the one
+    from normalization; without it bullets are looked for on the text's own lines.
+    """
+    words = text.split()
+    keyword_hits = SCORE_KEYWORD_MATCHER.scan(text)
+    if line_index is not None:
+        # The flat text has no line breaks left; bullets are found through the line index
+        bullet_count = count_bullet_lines(text, line_index)
+    else:
+        bullet_count = len(BULLET_LINE_RE.findall(text))
+
+    return ResumeFeatures(
+        word_count=len(words),
+        bullet_count=bullet_count,
+        readability=flesch_reading_ease(words),
+        grammar_errors=count_grammar_errors(doc) if doc is not None else 0,
+        tech_keywords=keyword_hits["tech"],
+        achievement_keywords=keyword_hits["achievement"],
+        action_verbs=keyword_hits["action"],
+        achievement_word_count=sum(1 for word in words if word.lower() in ACHIEVEMENT_WORD_SET),
+        has_proper_name=PROPER_NAME_RE.search(text) is not None,
+        proper_noun_pairs=len(PROPER_NOUN_PAIR_RE.findall(text)),
+        has_year=YEAR_RE.search(text) is not None,
+        has_at_sign='@' in text,
+        has_phone=PHONE_RE.search(text) is not None,
+        number_count=len(NUMBER_RE.findall(text)),
+        quantified_phrase_count=len(QUANTIFIED_PHRASE_RE.findall(text)),
+    )
@@ -0,0 +1,255 @@
+import asyncio
+import hashlib
+import heapq
+import os
+import re
+from collections import Counter
+
+from utils.cache_store import create_cache_store
+from utils.job_profile import DESC_WORD_RE, JOB_TECH_KEYWORDS, STOP_WORDS, normalize_skills
+from utils.pdf_extractors import get_pdf_backend
+from utils.resume_parser import PARSER_VERSION
+from utils.text_cache import extract_text_cached, get_content_hash
+from utils.workers import run_in_process_pool
+
+# Bump whenever the indexed terms change, so the index is rebuilt
+INDEX_VERSION = 2
+
+# One row per upload; the posting lists live in ResumeIndex, so rows skip the memory tier
+index_store = create_cache_store("resume_index", memory_items=0)
+# Key of the single whole-index row written by INDEX_VERSION 1
+LEGACY_INDEX_KEY = "uploads"
+
+TERM_RE = re.compile(r'\w+')
+RESUME_EXTENSIONS = ('.pdf', '.docx')
+# Corrected copies the analyzer writes next to the original uploads
+GENERATED_PREFIX = "updated-"
+
+# Points of each part of the index score, as in match_resume_to_profile
+SKILLS_POINTS = 50
+DESCRIPTION_POINTS = 30
+KEYWORDS_POINTS = 20
+
+
+def index_version():
+    return f"{INDEX_VERSION}:{PARSER_VERSION}:{get_pdf_backend().name}"
+
+
+def file_key(name):
+    """Key of an upload's row in the index store."""
+    return hashlib.md5(name.encode("utf-8")).hexdigest()
+
+
+def list_resume_files(directory):
+    """{name: (size, mtime)} of the resumes in the directory, skipping generated copies."""
+    listing = {}
+    with os.scandir(directory) as entries:
+        for dir_entry in entries:
+            name = dir_entry.name
+            if name.lower().endswith(RESUME_EXTENSIONS) and not name.startswith(GENERATED_PREFIX) \
+                    and dir_entry.is_file():
+                stat = dir_entry.stat()
+                listing[name] = (stat.st_size, stat.st_mtime_ns)
+    return listing
+
+
+def index_resume_file(path):
+    """
+    Build the index entry of one upload inside a worker process: the file's size,
+    modification time and content hash, the words of its text and the words of its
+    parsed skills section.
+    """
+    with open(path, 'rb') as f:
+        file_content = f.read()
+        file_stat = os.fstat(f.fileno())
+    entry = {"size": file_stat.st_size, "mtime": file_stat.st_mtime_ns}
+    if not file_content:
+        return {**entry, "error": "File is empty"}
+    file_hash = get_content_hash(file_content)
+    text, sections, _ = extract_text_cached(file_content, os.path.basename(path), file_hash)
+    skill_terms = {term for skill in sections.get('skills', []) for term in TERM_RE.findall(skill.lower())}
+    return {
+        **entry,
+        "hash": file_hash,
+        "terms": sorted(set(TERM_RE.findall(text.lower()))),
+        "skills": sorted(skill_terms),
+    }
+
+
+def intersect(postings, terms):
+    """Names in the posting lists of all terms, intersecting the shortest lists first."""
+    lists = [postings.get(term) for term in set(terms)]
+    if not lists or not all(lists):
+        return set()
+    lists.sort(key=len)
+    names = set(lists[0])
+    for names_with_term in lists[1:]:
+        names &= names_with_term
+        if not names:
+            break
+    return names
+
+
+class ResumeIndex:
+    """
+    Inverted index over the resumes in the uploads directory.
+
+    Maps every word of a resume's text (and, separately, of its parsed skills section)
+    to the upload file names that contain it. Each file's entry (size, mtime, hash and
+    terms) is persisted as its own row of the "resume_index" cache store, so indexing a
+    new upload writes one row; the posting lists are rebuilt from the rows of the files
+    in the directory when the index is loaded.
+    """
+
+    def __init__(self, version, files=None):
+        self.version = version
+        self.files = {}
+        self.postings = {}
+        self.skill_postings = {}
+        for name, entry in (files or {}).items():
+            self._add(name, entry)
+
+    @classmethod
+    def load(cls, directory):
+        """The index of the directory's files from their stored rows (rows of another version are skipped)."""
+        version = index_version()
+        index_store.delete(LEGACY_INDEX_KEY)
+        files = {}
+        for name in list_resume_files(directory):
+            stored = index_store.get(file_key(name))
+            if stored is not None and stored.get("version") == version and stored.get("name") == name:
+                files[name] = stored["entry"]
+        return cls(version, files)
+
+    def save_file(self, name):
+        """Store one file's row, or delete it once the file has left the index."""
+        entry = self.files.get(name)
+        if entry is None:
+            index_store.delete(file_key(name))
+        else:
+            index_store.set(file_key(name), {"version": self.version, "name": name, "entry": entry})
+
+    def _add(self, name, entry):
+        self.files[name] = entry
+        for term in entry.get("terms", ()):
+            self.postings.setdefault(term, set()).add(name)
+        for term in entry.get("skills", ()):
+            self.skill_postings.setdefault(term, set()).add(name)
+
+    def _remove(self, name):
+        entry = self.files.pop(name)
+        for postings, terms in ((self.postings, entry.get("terms", ())), (self.skill_postings, entry.get("skills", ()))):
+            for term in terms:
+                names = postings[term]
+                names.discard(name)
+                if not names:
+                    del postings[term]
+
+    def update(self, name, entry):
+        """Replace a file's entry (None removes the file from the index)."""
+        if name in self.files:
+            self._remove(name)
+        if entry is not None:
+            self._add(name, entry)
+
+    def changed_files(self, directory):
+        """(names no longer in the directory, names that are new or changed since they were indexed)."""
+        listing = list_resume_files(directory)
+        removed = [name for name in self.files if name not in listing]
+        changed = [name for name, (size, mtime) in listing.items()
+                   if name not in self.files or (self.files[name]["size"], self.files[name]["mtime"]) != (size, mtime)]
+        return removed, changed
+
+    async def refresh(self, directory):
+        """
+        Index new and changed uploads in the worker pool and drop deleted ones, storing
+        only their rows; returns True if anything changed.
+        """
+        removed, changed = await asyncio.to_thread(self.changed_files, directory)
+        if not removed and not changed:
+            return False
+
+        async def index_file(name):
+            path = os.path.join(directory, name)
+            try:
+                return await run_in_process_pool(index_resume_file, path)
+            except Exception as e:
+                # Keep the failure so the file is only retried once it changes
+                print(f"Error indexing resume {name}: {e}")
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    return None
+                return {"size": stat.st_size, "mtime": stat.st_mtime_ns, "error": str(e)}
+
+        entries = await asyncio.gather(*(index_file(name) for name in changed))
+        for name in removed:
+            self.update(name, None)
+        for name, entry in zip(changed, entries):
+            self.update(name, entry)
+
+        def save_changes():
+            for name in removed + changed:
+                self.save_file(name)
+
+        await asyncio.to_thread(save_changes)
+        print(f"Resume index: {len(changed)} files indexed, {len(removed)} removed, {len(self.files)} total")
+        return True
+
+    def skill_candidates(self, skill):
+        """
+        Names of the resumes that match a required skill the way match_resume_to_profile
+        counts it, with words standing in for substrings: all of the skill's words in the
+        text or the skills section, or at least half of its words (of 4+ letters) in the text.
+        """
+        terms = TERM_RE.findall(skill)
+        if not terms:
+            return set()
+        names = intersect(self.postings, terms) | intersect(self.skill_postings, terms)
+        needed = len(skill.split()) * 0.5
+        long_words = [word for word in skill.split() if len(word) > 3]
+        if long_words and len(long_words) >= needed:
+            found = Counter(name for word in long_words for name in intersect(self.postings, TERM_RE.findall(word)))
+            names.update(name for name, count in found.items() if count >= needed)
+        return names
+
+    def search(self, required_skills, job_description, limit):
+        """
+        Score resumes against a job from the posting lists alone and return the best
+        (name, index score) pairs, highest first, plus how many resumes scored at all.
+        The index score approximates match_resume_to_profile with whole-word lookups.
+        """
+        scores = Counter()
+
+        skills = [skill for skill in normalize_skills(required_skills) if skill]
+        for skill in skills:
+            for name in self.skill_candidates(skill):
+                scores[name] += SKILLS_POINTS / len(skills)
+
+        desc_words = [word for word in DESC_WORD_RE.findall((job_description or "").lower()) if word not in STOP_WORDS]
+        for word, count in Counter(desc_words).items():
+            for name in self.postings.get(word, ()):
+                scores[name] += DESCRIPTION_POINTS * count / len(desc_words)
+
+        for keyword in JOB_TECH_KEYWORDS:
+            for name in intersect(self.postings, TERM_RE.findall(keyword)):
+                scores[name] += KEYWORDS_POINTS / len(JOB_TECH_KEYWORDS)
+
+        best = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return best, len(scores)
+
+
+_resume_index = None
+_resume_index_lock = None
+
+
+async def get_resume_index(directory):
+    """The shared upload index, brought up to date with the directory (persisted when it changed)."""
+    global _resume_index, _resume_index_lock
+    if _resume_index_lock is None:
+        _resume_index_lock = asyncio.Lock()
+    async with _resume_index_lock:
+        if _resume_index is None:
+            _resume_index = await asyncio.to_thread(ResumeIndex.load, directory)
+        await _resume_index.refresh(directory)
+        return _resume_index
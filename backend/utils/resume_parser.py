@@ -1,4 +1,3 @@
-from PyPDF2 import PdfReader
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_BREAK
@@ -6,20 +5,57 @@ from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.oxml.shared import OxmlElement, qn
 import os
 import re
-import spacy
-import textstat
-import unicodedata
 from datetime import datetime
 import json
+from utils.section_parser import extract_resume_sections
+from utils.job_profile import JOB_TECH_KEYWORDS, JobProfile
+from utils.pdf_extractors import read_pdf_text
+from utils.docx_extractor import read_docx_text
+from utils.text_normalizer import normalize_text
+from utils.resume_features import extract_resume_features
 
-# Load spaCy model once, with minimal components for consistency
-nlp = spacy.load("en_core_web_sm", disable=["ner", "lemmatizer"])
+# spaCy pipeline, loaded on first use by get_nlp()
+_nlp = None
+# Only the start of each resume goes through spaCy
+NLP_CHAR_LIMIT = 10000
 
-def extract_text(file):
+def get_nlp():
+    """Return the shared spaCy pipeline, loading it on first use.
+
+    Only sentence boundaries are needed (for the grammar check). RESUME_NLP_MODE=fast
+    uses spaCy's rule-based sentencizer instead of the statistical parser, which loads
+    almost instantly and is much cheaper per resume.
+    """
+    global _nlp
+    if _nlp is None:
+        import spacy
+        mode = os.environ.get("RESUME_NLP_MODE", "full").strip().lower()
+        if mode != "fast":
+            try:
+                # The parser provides doc.sents; the other components are not used
+                _nlp = spacy.load("en_core_web_sm", disable=["ner", "lemmatizer", "tagger", "attribute_ruler"])
+            except OSError as e:
+                print(f"spaCy model en_core_web_sm not available ({e}), using fast sentence splitter")
+        if _nlp is None:
+            _nlp = spacy.blank("en")
+            _nlp.add_pipe("sentencizer")
+    return _nlp
+
+# Bump whenever extract_text or extract_resume_sections output changes,
+# so cached extractions from an older parser are re-parsed
+PARSER_VERSION = 2
+
+def extract_text(file, raw_text=None):
     """Extract text from PDF or DOCX file with normalization.
     
     Supports both FastAPI UploadFile objects and file-like objects (BytesIO, file handles).
+    raw_text, when given, is text already read from the file (e.g. PDF pages extracted in
+    parallel) and is only normalized.
     """
+    return extract_text_and_lines(file, raw_text)[0]
+
+def extract_text_and_lines(file, raw_text=None):
+    """Like extract_text, but returns (text, line_index) with the line layout of the text."""
     try:
         # Determine if it's a FastAPI UploadFile or a regular file-like object
         if hasattr(file, 'file') and hasattr(file, 'filename'):
@@ -40,278 +76,223 @@ def extract_text(file):
         
         # Extract text based on file type
         text = ""
-        if filename.lower().endswith(".pdf"):
-            reader = PdfReader(file_obj)
-            text = "".join(page.extract_text() or "" for page in reader.pages)
+        if raw_text is not None:
+            text = raw_text
+        elif filename.lower().endswith(".pdf"):
+            # Pages are read one at a time by the configured backend (RESUME_PDF_BACKEND)
+            text = read_pdf_text(file_obj)
         elif filename.lower().endswith((".doc", ".docx")):
-            doc = Document(file_obj)
-            text = "\n".join(para.text for para in doc.paragraphs if para.text.strip())
+            # Streams word/document.xml; same text as python-docx's Document(...).paragraphs
+            text = read_docx_text(file_obj)
         else:
             raise ValueError(f"Unsupported file format: {filename}")
 
-        # Normalize text to remove encoding issues and extra whitespace
-        text = unicodedata.normalize("NFKD", text)
-        text = re.sub(r'\s+', ' ', text.strip())
+        # Normalize text to remove encoding issues and extra whitespace, keeping the line layout
+        text, line_index = normalize_text(text)
         if not text:
             raise ValueError("No text extracted from file")
         print(f"Extracted text (first 200 chars): {text[:200]}")  # Debug
-        return text
+        return text, line_index
     except Exception as e:
         raise Exception(f"Failed to parse resume: {str(e)}")
 
-def extract_resume_sections(text):
-    """Extract structured information from resume text."""
-    sections = {
-        'contact': {},
-        'summary': '',
-        'experience': [],
-        'education': [],
-        'skills': [],
-        'projects': [],
-        'achievements': []
-    }
-    
-    # Extract contact information
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    phone_pattern = r'(\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})'
-    linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-    
-    emails = re.findall(email_pattern, text)
-    phones = re.findall(phone_pattern, text)
-    linkedin = re.findall(linkedin_pattern, text, re.IGNORECASE)
-    
-    if emails:
-        sections['contact']['email'] = emails[0]
-    if phones:
-        sections['contact']['phone'] = ''.join(phones[0])
-    if linkedin:
-        sections['contact']['linkedin'] = linkedin[0]
-    
-    # Extract summary/objective
-    summary_patterns = [
-        r'(?:summary|objective|profile|about)[\s:]*([^.]+(?:\.[^.]*)*)',
-        r'(?:professional\s+summary|career\s+objective)[\s:]*([^.]+(?:\.[^.]*)*)'
-    ]
-    
-    for pattern in summary_patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-        if match:
-            sections['summary'] = match.group(1).strip()
-            break
-    
-    # Extract experience
-    exp_pattern = r'(?:experience|work\s+history|employment)[\s:]*([\s\S]*?)(?=education|skills|projects|$|education|skills|projects)'
-    exp_match = re.search(exp_pattern, text, re.IGNORECASE | re.DOTALL)
-    if exp_match:
-        exp_text = exp_match.group(1)
-        # Simple extraction of job entries
-        job_entries = re.split(r'\n\s*\n', exp_text)
-        for entry in job_entries:
-            if entry.strip() and len(entry.strip()) > 20:
-                sections['experience'].append(entry.strip())
-    
-    # Extract education
-    edu_pattern = r'(?:education|academic|qualification)[\s:]*([\s\S]*?)(?=experience|skills|projects|$|experience|skills|projects)'
-    edu_match = re.search(edu_pattern, text, re.IGNORECASE | re.DOTALL)
-    if edu_match:
-        edu_text = edu_match.group(1)
-        edu_entries = re.split(r'\n\s*\n', edu_text)
-        for entry in edu_entries:
-            if entry.strip() and len(entry.strip()) > 10:
-                sections['education'].append(entry.strip())
-    
-    # Extract skills
-    skills_patterns = [
-        r'(?:skills|technical\s+skills|competencies)[\s:]*([\s\S]*?)(?=experience|education|projects|$|experience|education|projects)',
-        r'(?:programming\s+languages|technologies)[\s:]*([\s\S]*?)(?=experience|education|projects|$|experience|education|projects)'
-    ]
-    
-    for pattern in skills_patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-        if match:
-            skills_text = match.group(1)
-            # Extract skills separated by commas, semicolons, or newlines
-            skills = re.split(r'[,;\n]', skills_text)
-            for skill in skills:
-                skill = skill.strip()
-                if skill and len(skill) > 1:
-                    sections['skills'].append(skill)
-            break
-    
-    return sections
+def compute_resume_score(text, sections=None, line_index=None):
+    """Compute comprehensive professionalism score (0-100) with detailed analysis.
+    Returns (score, issues, sections, score_dict).
+
+    Pass pre-extracted sections (e.g. from the text cache) to skip re-parsing them, and the
+    line_index from extraction so bullets and section entries can be found in the flat text.
+    """
+    return score_resume_text(text, sections, line_index)[:4]
 
-def compute_resume_score(text):
-    """Compute comprehensive professionalism score (0-100) with detailed analysis."""
+def compute_resume_scores(texts, sections_list=None, line_indexes=None, batch_size=32, n_process=1):
+    """Score many resumes at once, running spaCy over them in batches with nlp.pipe.
+
+    Returns one (score, issues, sections, score_dict) tuple per text, in order, exactly
+    as compute_resume_score would. n_process > 1 makes spaCy fork its own processes,
+    so only use it from the main process (not from inside the resume worker pool).
+    """
+    return [scored[:4] for scored in score_resume_texts(texts, sections_list, line_indexes, batch_size, n_process)]
+
+def score_resume_text(text, sections=None, line_index=None):
+    """Like compute_resume_score, but returns (score, issues, sections, score_dict, features)."""
     try:
-        score_dict = {
-            "structure": 0,
-            "grammar": 0,
-            "readability": 0,
-            "keywords": 0,
-            "length": 0,
-            "contact": 0,
-            "achievements": 0,
-            "formatting": 0,
-            "action_verbs": 0,
-            "quantification": 0
-        }
+        doc = get_nlp()(text[:NLP_CHAR_LIMIT])
+    except Exception as e:
+        raise Exception(f"Score computation failed: {str(e)}")
+    return score_resume_doc(text, doc, sections, line_index)
 
-        # Extract structured sections
-        sections = extract_resume_sections(text)
-        
-        # Structure: Count sections and bullets (25 points)
-        standard_sections = ['summary', 'experience', 'education', 'skills']
-        found_sections = sum(1 for section in standard_sections if sections[section])
-        bullets = len(re.findall(r'^\s*[-•*]\s', text, re.MULTILINE))
-        score_dict["structure"] = min((found_sections * 5 + bullets * 1), 25)
-
-        # Grammar assessment (20 points)
-        doc = nlp(text[:10000])
-        grammar_errors = 0
-        for sent in doc.sents:
-            stripped = sent.text.strip()
-            if stripped and not stripped[0].isupper():
-                grammar_errors += 1
-            if len(stripped) > 30 and not stripped.endswith(('.', '!', '?')):
-                grammar_errors += 1
-        score_dict["grammar"] = max(20 - min(grammar_errors, 20), 0)
-
-        # Readability (15 points)
-        readability = textstat.flesch_reading_ease(text)
-        score_dict["readability"] = min(readability / 6.67, 15)
-
-        # Keywords and skills (15 points)
-        tech_keywords = [
-            "python", "javascript", "react", "sql", "management", "node", "java", 
-            "docker", "kubernetes", "aws", "azure", "gcp", "machine learning", 
-            "data analysis", "project management", "agile", "scrum", "git", 
-            "rest api", "microservices", "devops", "ci/cd", "tensorflow", "pytorch"
+def score_resume_texts(texts, sections_list=None, line_indexes=None, batch_size=32, n_process=1):
+    """Like compute_resume_scores, but returns (score, issues, sections, score_dict, features) tuples."""
+    texts = list(texts)
+    if sections_list is None:
+        sections_list = [None] * len(texts)
+    if line_indexes is None:
+        line_indexes = [None] * len(texts)
+    try:
+        docs = get_nlp().pipe((text[:NLP_CHAR_LIMIT] for text in texts), batch_size=batch_size, n_process=n_process)
+        return [
+            score_resume_doc(text, doc, sections, line_index)
+            for text, doc, sections, line_index in zip(texts, docs, sections_list, line_indexes)
         ]
-        keywords_found = sum(1 for word in tech_keywords if word.lower() in text.lower())
-        score_dict["keywords"] = min(keywords_found * 2, 15)
+    except Exception as e:
+        raise Exception(f"Score computation failed: {str(e)}")
 
-        # Length optimization (10 points)
-        word_count = len(text.split())
-        if 300 <= word_count <= 800:
-            score_dict["length"] = 10
-        else:
-            score_dict["length"] = max(10 - abs(word_count - 550) // 50, 0)
-
-        # Contact information (10 points)
-        contact_score = 0
-        if sections['contact'].get('email'):
-            contact_score += 4
-        if sections['contact'].get('phone'):
-            contact_score += 3
-        if sections['contact'].get('linkedin'):
-            contact_score += 3
-        score_dict["contact"] = contact_score
-
-        # Achievements and impact (5 points)
-        achievement_words = ['achieved', 'increased', 'improved', 'reduced', 'developed', 'created', 'managed', 'led', 'implemented']
-        achievement_count = sum(1 for word in achievement_words if word.lower() in text.lower())
-        score_dict["achievements"] = min(achievement_count, 5)
-
-        # Formatting and presentation (10 points)
-        formatting_score = 0
-        # Check for consistent formatting
-        if re.search(r'\b[A-Z][a-z]+\s+[A-Z][a-z]+', text):  # Proper name formatting
-            formatting_score += 2
-        if re.search(r'\d{4}', text):  # Has years/dates
-            formatting_score += 2
-        if len(re.findall(r'[A-Z][a-z]+\s+[A-Z][a-z]+', text)) > 2:  # Multiple proper nouns
-            formatting_score += 2
-        if re.search(r'@', text):  # Has email
-            formatting_score += 2
-        if re.search(r'\(\d{3}\)\s*\d{3}-\d{4}|\d{3}-\d{3}-\d{4}', text):  # Has phone
-            formatting_score += 2
-        score_dict["formatting"] = min(formatting_score, 10)
-
-        # Action verbs usage (5 points)
-        action_verbs = [
-            'achieved', 'accomplished', 'administered', 'analyzed', 'assisted', 'built', 'collaborated',
-            'created', 'delivered', 'designed', 'developed', 'executed', 'facilitated', 'generated',
-            'implemented', 'improved', 'increased', 'initiated', 'launched', 'led', 'managed',
-            'optimized', 'organized', 'performed', 'planned', 'produced', 'reduced', 'resolved',
-            'streamlined', 'supervised', 'transformed', 'utilized'
-        ]
-        action_verb_count = sum(1 for verb in action_verbs if verb.lower() in text.lower())
-        score_dict["action_verbs"] = min(action_verb_count, 5)
+def score_resume_doc(text, doc, sections=None, line_index=None):
+    """
+    Score a resume given its text and the spaCy doc for its first NLP_CHAR_LIMIT characters.
+    Returns (score, issues, sections, score_dict, features), features being the
+    ResumeFeatures record the score was computed from.
+    """
+    try:
+        # Extract structured sections
+        if sections is None:
+            sections = extract_resume_sections(text, line_index)
+        features = extract_resume_features(text, doc, line_index)
+        score, issues, score_dict = score_resume_features(features, sections)
+        return score, issues, sections, score_dict, features
+    except Exception as e:
+        raise Exception(f"Score computation failed: {str(e)}")
 
-        # Quantification and metrics (5 points)
-        # Look for numbers, percentages, dollar amounts, time periods
-        numbers = re.findall(r'\b\d+(?:\.\d+)?%?\b', text)
-        quantified_phrases = re.findall(r'\b(?:increased|decreased|reduced|improved|saved|generated|managed|led|supervised|trained|developed|created|built|delivered|achieved|accomplished|grew|expanded|optimized|streamlined|enhanced|boosted|raised|lowered|cut|eliminated|reduced|minimized|maximized|doubled|tripled|quadrupled|halved|by\s+\d+%?|\d+x|\d+\s+times|\d+\s+fold)\b', text, re.IGNORECASE)
-        quantification_score = min(len(numbers) + len(quantified_phrases), 5)
-        score_dict["quantification"] = quantification_score
 
-        total_score = sum(score_dict.values())
-        total_score = int(min(max(total_score, 0), 100))
+def score_resume_features(features, sections):
+    """Compute (score, issues, score_dict) from a resume's features and sections."""
+    score_dict = {
+        "structure": 0,
+        "grammar": 0,
+        "readability": 0,
+        "keywords": 0,
+        "length": 0,
+        "contact": 0,
+        "achievements": 0,
+        "formatting": 0,
+        "action_verbs": 0,
+        "quantification": 0
+    }
 
-        # Build comprehensive issue list
-        issues = []
-        
-        # Structure issues
-        if found_sections < 3:
-            issues.append("Add standard sections: Summary, Experience, Education, Skills.")
-        if bullets < 5:
-            issues.append("Use bullet points to highlight achievements and responsibilities.")
-        if not sections['summary']:
-            issues.append("Add a professional summary or objective statement.")
-        
-        # Grammar issues
-        if grammar_errors > 0:
-            issues.append(f"Fix capitalization and sentence punctuation in {grammar_errors} places.")
-        
-        # Readability issues
-        if readability < 50:
-            issues.append("Simplify sentences to improve readability (aim for 60+ Flesch score).")
-        
-        # Keyword issues
-        if keywords_found < 3:
-            issues.append("Include more role-relevant keywords and technical skills.")
-        
-        # Length issues
-        if word_count < 300:
-            issues.append("Resume is too short; add details on projects, achievements, and impact.")
-        elif word_count > 800:
-            issues.append("Resume is too long; trim to most relevant achievements and experiences.")
-        
-        # Contact issues
-        if not sections['contact'].get('email'):
-            issues.append("Add a professional email address.")
-        if not sections['contact'].get('phone'):
-            issues.append("Include a contact phone number.")
-        if not sections['contact'].get('linkedin'):
-            issues.append("Add your LinkedIn profile URL.")
-        
-        # Achievement issues
-        if achievement_count < 2:
-            issues.append("Include more quantifiable achievements and impact statements.")
-        
-        # Experience issues
-        if len(sections['experience']) < 2:
-            issues.append("Add more detailed work experience with specific achievements.")
-        
-        # Skills issues
-        if len(sections['skills']) < 5:
-            issues.append("Expand your skills section with relevant technical and soft skills.")
+    # Structure: Count sections and bullets (25 points)
+    standard_sections = ['summary', 'experience', 'education', 'skills']
+    found_sections = sum(1 for section in standard_sections if sections[section])
+    score_dict["structure"] = min((found_sections * 5 + features.bullet_count * 1), 25)
 
-        # Formatting issues
-        if score_dict["formatting"] < 6:
-            issues.append("Improve formatting consistency and professional presentation.")
-        
-        # Action verb issues
-        if score_dict["action_verbs"] < 3:
-            issues.append("Use more strong action verbs to describe your accomplishments.")
-        
-        # Quantification issues
-        if score_dict["quantification"] < 2:
-            issues.append("Add more numbers, percentages, and metrics to quantify your achievements.")
+    # Grammar assessment (20 points)
+    score_dict["grammar"] = max(20 - min(features.grammar_errors, 20), 0)
 
-        return total_score, issues, sections, score_dict
-    except Exception as e:
-        raise Exception(f"Score computation failed: {str(e)}")
+    # Readability (15 points)
+    score_dict["readability"] = min(features.readability / 6.67, 15)
+
+    # Keywords and skills (15 points)
+    keywords_found = len(features.tech_keywords)
+    score_dict["keywords"] = min(keywords_found * 2, 15)
+
+    # Length optimization (10 points)
+    word_count = features.word_count
+    if 300 <= word_count <= 800:
+        score_dict["length"] = 10
+    else:
+        score_dict["length"] = max(10 - abs(word_count - 550) // 50, 0)
+
+    # Contact information (10 points)
+    contact_score = 0
+    if sections['contact'].get('email'):
+        contact_score += 4
+    if sections['contact'].get('phone'):
+        contact_score += 3
+    if sections['contact'].get('linkedin'):
+        contact_score += 3
+    score_dict["contact"] = contact_score
+
+    # Achievements and impact (5 points)
+    achievement_count = len(features.achievement_keywords)
+    score_dict["achievements"] = min(achievement_count, 5)
+
+    # Formatting and presentation (10 points)
+    formatting_score = 0
+    # Check for consistent formatting
+    if features.has_proper_name:  # Proper name formatting
+        formatting_score += 2
+    if features.has_year:  # Has years/dates
+        formatting_score += 2
+    if features.proper_noun_pairs > 2:  # Multiple proper nouns
+        formatting_score += 2
+    if features.has_at_sign:  # Has email
+        formatting_score += 2
+    if features.has_phone:  # Has phone
+        formatting_score += 2
+    score_dict["formatting"] = min(formatting_score, 10)
+
+    # Action verbs usage (5 points)
+    score_dict["action_verbs"] = min(len(features.action_verbs), 5)
+
+    # Quantification and metrics (5 points)
+    # Numbers, percentages, dollar amounts, time periods and impact phrases
+    score_dict["quantification"] = min(features.number_count + features.quantified_phrase_count, 5)
+
+    total_score = sum(score_dict.values())
+    total_score = int(min(max(total_score, 0), 100))
+
+    # Build comprehensive issue list
+    issues = []
+
+    # Structure issues
+    if found_sections < 3:
+        issues.append("Add standard sections: Summary, Experience, Education, Skills.")
+    if features.bullet_count < 5:
+        issues.append("Use bullet points to highlight achievements and responsibilities.")
+    if not sections['summary']:
+        issues.append("Add a professional summary or objective statement.")
+
+    # Grammar issues
+    if features.grammar_errors > 0:
+        issues.append(f"Fix capitalization and sentence punctuation in {features.grammar_errors} places.")
+
+    # Readability issues
+    if features.readability < 50:
+        issues.append("Simplify sentences to improve readability (aim for 60+ Flesch score).")
+
+    # Keyword issues
+    if keywords_found < 3:
+        issues.append("Include more role-relevant keywords and technical skills.")
+
+    # Length issues
+    if word_count < 300:
+        issues.append("Resume is too short; add details on projects, achievements, and impact.")
+    elif word_count > 800:
+        issues.append("Resume is too long; trim to most relevant achievements and experiences.")
+
+    # Contact issues
+    if not sections['contact'].get('email'):
+        issues.append("Add a professional email address.")
+    if not sections['contact'].get('phone'):
+        issues.append("Include a contact phone number.")
+    if not sections['contact'].get('linkedin'):
+        issues.append("Add your LinkedIn profile URL.")
+
+    # Achievement issues
+    if achievement_count < 2:
+        issues.append("Include more quantifiable achievements and impact statements.")
+
+    # Experience issues
+    if len(sections['experience']) < 2:
+        issues.append("Add more detailed work experience with specific achievements.")
+
+    # Skills issues
+    if len(sections['skills']) < 5:
+        issues.append("Expand your skills section with relevant technical and soft skills.")
+
+    # Formatting issues
+    if score_dict["formatting"] < 6:
+        issues.append("Improve formatting consistency and professional presentation.")
+
+    # Action verb issues
+    if score_dict["action_verbs"] < 3:
+        issues.append("Use more strong action verbs to describe your accomplishments.")
+
+    # Quantification issues
+    if score_dict["quantification"] < 2:
+        issues.append("Add more numbers, percentages, and metrics to quantify your achievements.")
+
+    return total_score, issues, score_dict
 
 
 def add_hyperlink(paragraph, text, url):
@@ -486,27 +467,47 @@ def generate_enhanced_resume(original_file, output_dir, sections):
     except Exception as e:
         raise Exception(f"Failed to generate enhanced resume: {str(e)}")
 
-def match_resume_to_job(resume_text, job_description, required_skills):
+def match_error_details(error):
+    """Zero-score match details returned when matching fails."""
+    print(f"Error matching resume to job: {str(error)}")
+    return {
+        "skills_match": 0,
+        "description_match": 0,
+        "keywords_match": 0,
+        "total_score": 0,
+        "matched_skills": [],
+        "missing_skills": [],
+        "error": str(error)
+    }
+
+def match_resume_to_job(resume_text, job_description, required_skills, resume_sections=None, whole_word=False):
     """
     Match a resume against job description and required skills.
     Returns a match score (0-100) and matching details.
+    Pass pre-extracted resume_sections to skip re-parsing them; whole_word=True only
+    counts description words found as complete words (see JobProfile).
+    """
+    try:
+        profile = JobProfile(job_description, required_skills, whole_word)
+    except Exception as e:
+        return match_error_details(e)
+    return match_resume_to_profile(resume_text, profile, resume_sections)
+
+def match_resume_to_profile(resume_text, profile, resume_sections=None):
+    """
+    Match a resume against a prebuilt JobProfile (see utils.job_profile.get_job_profile).
+    Only resume-side work is done here, so one profile can be reused for a whole batch.
     """
     try:
         resume_lower = resume_text.lower()
-        job_desc_lower = job_description.lower() if job_description else ""
         
         # Extract skills from resume
-        resume_sections = extract_resume_sections(resume_text)
+        if resume_sections is None:
+            resume_sections = extract_resume_sections(resume_text)
         resume_skills = [skill.lower() for skill in resume_sections.get('skills', [])]
         resume_skills_text = ' '.join(resume_skills).lower()
         
-        # Normalize required skills
-        if isinstance(required_skills, str):
-            required_skills_list = [skill.strip().lower() for skill in required_skills.split(',')]
-        elif isinstance(required_skills, list):
-            required_skills_list = [str(skill).strip().lower() for skill in required_skills]
-        else:
-            required_skills_list = []
+        required_skills_list = profile.required_skills
         
         # Calculate match score components
         match_details = {
@@ -518,6 +519,11 @@ def match_resume_to_job(resume_text, job_description, required_skills):
             "missing_skills": []
         }
         
+        # Scan the resume once for required skills, their words and technical keywords
+        matcher = profile.matcher
+        resume_hits = matcher.scan(resume_text)
+        skills_text_hits = None
+        
         # 1. Skills Matching (50 points)
         if required_skills_list:
             matched_skills = []
@@ -532,15 +538,20 @@ def match_resume_to_job(resume_text, job_description, required_skills):
                 skill_found = False
                 
                 # Exact match
-                if skill_clean in resume_skills_text or skill_clean in resume_lower:
+                if skill_clean in resume_hits["skills"]:
                     skill_found = True
                 else:
-                    # Partial match - check if key words from skill are in resume
-                    skill_words = skill_clean.split()
-                    if len(skill_words) > 0:
+                    # The joined skills list can contain phrases the full text does not
+                    if skills_text_hits is None:
+                        skills_text_hits = matcher.scan(resume_skills_text)
+                    if skill_clean in skills_text_hits["skills"]:
+                        skill_found = True
+                    else:
+                        # Partial match - check if key words from skill are in resume
+                        total_words = len(skill_clean.split())
                         # Check if at least 50% of skill words are found
-                        found_words = sum(1 for word in skill_words if len(word) > 3 and word in resume_lower)
-                        if found_words >= len(skill_words) * 0.5:
+                        found_words = sum(1 for word in profile.skill_words[skill] if word in resume_hits["skill_words"])
+                        if found_words >= total_words * 0.5:
                             skill_found = True
                 
                 if skill_found:
@@ -561,38 +572,18 @@ def match_resume_to_job(resume_text, job_description, required_skills):
             match_details["skills_match"] = 0
         
         # 2. Job Description Keywords Matching (30 points)
-        if job_desc_lower:
-            # Extract important keywords from job description
-            # Remove common stop words
-            stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'}
-            
-            # Extract meaningful words (3+ characters, not stop words)
-            desc_words = [word for word in re.findall(r'\b\w{3,}\b', job_desc_lower) 
-                         if word not in stop_words]
-            
+        if profile.desc_word_total:
             # Count how many job description keywords appear in resume
-            matching_keywords = [word for word in desc_words if word in resume_lower]
-            
-            if len(desc_words) > 0:
-                keyword_match_ratio = len(matching_keywords) / len(desc_words)
-                match_details["description_match"] = int(keyword_match_ratio * 30)
-            else:
-                match_details["description_match"] = 0
+            matching_keywords = profile.description_hits(resume_hits, resume_lower)
+            keyword_match_ratio = matching_keywords / profile.desc_word_total
+            match_details["description_match"] = int(keyword_match_ratio * 30)
         else:
             match_details["description_match"] = 0
         
         # 3. General Technical Keywords (20 points)
-        # Common technical terms that might be relevant
-        tech_keywords = [
-            "python", "javascript", "react", "sql", "java", "node", "html", "css",
-            "data analysis", "machine learning", "statistics", "excel", "power bi", "tableau",
-            "project management", "agile", "scrum", "git", "docker", "aws", "azure",
-            "database", "api", "rest", "json", "xml", "linux", "windows", "cloud"
-        ]
-        
-        found_tech_keywords = [kw for kw in tech_keywords if kw in resume_lower]
-        if len(tech_keywords) > 0:
-            tech_match_ratio = len(found_tech_keywords) / len(tech_keywords)
+        found_tech_keywords = resume_hits["tech"]
+        if len(JOB_TECH_KEYWORDS) > 0:
+            tech_match_ratio = len(found_tech_keywords) / len(JOB_TECH_KEYWORDS)
             match_details["keywords_match"] = int(tech_match_ratio * 20)
         else:
             match_details["keywords_match"] = 0
@@ -610,13 +601,4 @@ def match_resume_to_job(resume_text, job_description, required_skills):
         return match_details
         
     except Exception as e:
-        print(f"Error matching resume to job: {str(e)}")
-        return {
-            "skills_match": 0,
-            "description_match": 0,
-            "keywords_match": 0,
-            "total_score": 0,
-            "matched_skills": [],
-            "missing_skills": [],
-            "error": str(e)
-        }
\ No newline at end of file
+        return match_error_details(e)
\ No newline at end of file
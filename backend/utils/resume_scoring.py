@@ -0,0 +1,64 @@
+import time
+
+from utils.resume_parser import score_resume_text, score_resume_texts
+from utils.text_cache import extract_text_cached
+
+
+def score_resume_files(files):
+    """
+    Extract and score a chunk of resume files inside one worker process.
+
+    files is a list of (file_content, filename, file_hash, raw_text) tuples, raw_text being
+    None unless the file's text was already read elsewhere. Returns one dict per
+    file, in order, with the text and score parts (including the ResumeFeatures record),
+    or an "error" for files that failed.
+    Text comes from the shared text cache; scoring runs spaCy over the chunk with nlp.pipe.
+    """
+    results = [{"filename": filename, "hash": file_hash} for _, filename, file_hash, _ in files]
+
+    parsed = []
+    for i, (file_content, filename, file_hash, raw_text) in enumerate(files):
+        started = time.perf_counter()
+        try:
+            text, sections, line_index = extract_text_cached(file_content, filename, file_hash, raw_text)
+        except Exception as e:
+            results[i]["error"] = str(e)
+            continue
+        results[i]["extract_seconds"] = time.perf_counter() - started
+        parsed.append((i, text, sections, line_index))
+
+    if not parsed:
+        return results
+
+    started = time.perf_counter()
+    try:
+        scores = score_resume_texts([text for _, text, _, _ in parsed], [sections for _, _, sections, _ in parsed],
+                                       [line_index for _, _, _, line_index in parsed])
+        score_seconds = [(time.perf_counter() - started) / len(parsed)] * len(parsed)
+    except Exception as e:
+        # One bad resume should not fail the whole chunk; score the files one by one
+        print(f"Batch scoring failed, scoring files individually: {e}")
+        scores, score_seconds = [], []
+        for _, text, sections, line_index in parsed:
+            started = time.perf_counter()
+            try:
+                scores.append(score_resume_text(text, sections, line_index))
+            except Exception as err:
+                scores.append(err)
+            score_seconds.append(time.perf_counter() - started)
+
+    for (i, text, _, _), score, seconds in zip(parsed, scores, score_seconds):
+        if isinstance(score, Exception):
+            results[i]["error"] = str(score)
+            continue
+        score_value, issues, sections, score_dict, features = score
+        results[i].update({
+            "text": text,
+            "score": score_value,
+            "issues": issues,
+            "sections": sections,
+            "score_dict": score_dict,
+            "features": features,
+            "score_seconds": seconds,
+        })
+    return results
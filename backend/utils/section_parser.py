@@ -0,0 +1,172 @@
+import re
+from bisect import bisect_left
+
+from utils.text_normalizer import line_offsets, paragraph_offsets, split_at
+
+# Contact patterns (only the first match of each is used)
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_RE = re.compile(r'(\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})')
+LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w-]+', re.IGNORECASE)
+
+# All section heading keywords. The lookahead makes a single finditer report every
+# occurrence, including overlapping ones such as "skills" inside "technical skills".
+HEADING_PATTERN = (
+    r'(?=(summary|objective|profile|about'
+    r'|experience|work\s+history|employment'
+    r'|education|academic|qualification'
+    r'|technical\s+skills|skills|competencies'
+    r'|programming\s+languages|technologies'
+    r'|projects))'
+)
+HEADING_RE = re.compile(HEADING_PATTERN)
+HEADING_RE_IGNORECASE = re.compile(HEADING_PATTERN, re.IGNORECASE)
+
+# Case-insensitive regex matching also treats these characters as ASCII letters;
+# mapping them lets the fast lowercase scan find exactly what re.IGNORECASE finds
+CASEFOLD_FIXES = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'})
+
+# Which section a heading keyword opens, keyed by its first word
+HEADING_KINDS = {
+    'summary': 'summary', 'objective': 'summary', 'profile': 'summary', 'about': 'summary',
+    'experience': 'experience', 'work': 'experience', 'employment': 'experience',
+    'education': 'education', 'academic': 'education', 'qualification': 'education',
+    'technical': 'skills', 'skills': 'skills', 'competencies': 'skills',
+    'programming': 'technologies', 'technologies': 'technologies',
+}
+# Single-word headings that end the section before them
+SECTION_STOP_WORDS = ('experience', 'education', 'skills', 'projects')
+
+SEPARATOR_RE = re.compile(r'[\s:]*')
+ENTRY_SPLIT_RE = re.compile(r'\n\s*\n')
+SKILL_SPLIT_RE = re.compile(r'[,;\n]')
+LINE_SPLIT_RE = re.compile(r'\n')
+
+
+def find_headings(text):
+    """
+    Scan the text once for heading keywords.
+    Returns (starts, stops): start/end spans per section kind, and positions per stop word.
+    """
+    starts = {kind: [] for kind in set(HEADING_KINDS.values())}
+    stops = {word: [] for word in SECTION_STOP_WORDS}
+
+    lowered = text.translate(CASEFOLD_FIXES).lower()
+    if len(lowered) == len(text):
+        matches = HEADING_RE.finditer(lowered)
+    else:
+        # Lowercasing changed offsets; fall back to a case-insensitive scan
+        matches = HEADING_RE_IGNORECASE.finditer(text)
+
+    for match in matches:
+        keyword = match.group(1)
+        start = match.start()
+        key = keyword.translate(CASEFOLD_FIXES).lower()
+        kind = HEADING_KINDS.get(key.split(None, 1)[0])
+        if kind:
+            starts[kind].append((start, start + len(keyword)))
+        if key in stops:
+            stops[key].append(start)
+    return starts, stops
+
+
+def section_span(text, headings, stops, stop_words):
+    """(start, end) of the text after the first heading, up to the next stop word heading (or end of text)."""
+    if not headings:
+        return None
+    body_start = SEPARATOR_RE.match(text, headings[0][1]).end()
+    body_end = len(text)
+    for word in stop_words:
+        positions = stops[word]
+        i = bisect_left(positions, body_start)
+        if i < len(positions) and positions[i] < body_end:
+            body_end = positions[i]
+    return body_start, body_end
+
+
+def split_section(text, span, split_re, boundaries):
+    """
+    Split a section body into pieces: at the given flat-text offsets when the text came
+    with a line index, otherwise with split_re on the text's own line breaks.
+    """
+    if boundaries is None:
+        return split_re.split(text[span[0]:span[1]])
+    return split_at(text, span[0], span[1], boundaries)
+
+
+def find_summary(text, headings):
+    """The summary runs from the first usable summary/objective/profile/about heading to the end."""
+    for _, heading_end in headings:
+        body_start = SEPARATOR_RE.match(text, heading_end).end()
+        if body_start < len(text) and text[body_start] != '.':
+            return text[body_start:].strip()
+        if body_start > heading_end:
+            # The summary must start with a non-period, so it takes back one separator
+            return text[body_start - 1:].strip()
+    return None
+
+
+def extract_resume_sections(text, line_index=None):
+    """Extract structured information from resume text.
+
+    Pass the line_index from normalization for flat text: experience and education entries
+    are then split at paragraph breaks and skills at line breaks, which the flat text lost.
+    """
+    sections = {
+        'contact': {},
+        'summary': '',
+        'experience': [],
+        'education': [],
+        'skills': [],
+        'projects': [],
+        'achievements': []
+    }
+
+    # Extract contact information
+    email = EMAIL_RE.search(text)
+    phone = PHONE_RE.search(text)
+    linkedin = LINKEDIN_RE.search(text)
+
+    if email:
+        sections['contact']['email'] = email.group(0)
+    if phone:
+        sections['contact']['phone'] = ''.join(part or '' for part in phone.groups())
+    if linkedin:
+        sections['contact']['linkedin'] = linkedin.group(0)
+
+    # Find all heading boundaries in one pass
+    starts, stops = find_headings(text)
+    paragraph_starts = paragraph_offsets(line_index) if line_index is not None else None
+    line_starts = line_offsets(line_index) if line_index is not None else None
+
+    # Extract summary/objective
+    summary = find_summary(text, starts['summary'])
+    if summary is not None:
+        sections['summary'] = summary
+
+    # Extract experience
+    exp_span = section_span(text, starts['experience'], stops, ('education', 'skills', 'projects'))
+    if exp_span is not None:
+        # Simple extraction of job entries
+        for entry in split_section(text, exp_span, ENTRY_SPLIT_RE, paragraph_starts):
+            if entry.strip() and len(entry.strip()) > 20:
+                sections['experience'].append(entry.strip())
+
+    # Extract education
+    edu_span = section_span(text, starts['education'], stops, ('experience', 'skills', 'projects'))
+    if edu_span is not None:
+        for entry in split_section(text, edu_span, ENTRY_SPLIT_RE, paragraph_starts):
+            if entry.strip() and len(entry.strip()) > 10:
+                sections['education'].append(entry.strip())
+
+    # Extract skills, falling back to programming languages/technologies headings
+    skills_span = section_span(text, starts['skills'] or starts['technologies'], stops,
+                               ('experience', 'education', 'projects'))
+    if skills_span is not None:
+        # Extract skills separated by commas, semicolons, or newlines
+        for line in split_section(text, skills_span, LINE_SPLIT_RE, line_starts):
+            for skill in SKILL_SPLIT_RE.split(line):
+                skill = skill.strip()
+                if skill and len(skill) > 1:
+                    sections['skills'].append(skill)
+
+    return sections
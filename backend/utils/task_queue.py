@@ -0,0 +1,137 @@
+import asyncio
+import os
+import time
+import uuid
+from datetime import datetime
+
+# Background analysis tasks, kept in memory by task id (lost when the server restarts)
+_tasks = {}
+_running = {}
+_task_slots = None
+
+# Finished tasks (and their results) are kept this long for polling
+TASK_TTL_SECONDS = 60 * 60
+
+
+def get_task_concurrency():
+    """Number of tasks allowed to run at once, configurable via RESUME_TASK_CONCURRENCY."""
+    value = os.environ.get("RESUME_TASK_CONCURRENCY", "").strip()
+    try:
+        concurrency = int(value) if value else 2
+    except ValueError:
+        print(f"Invalid RESUME_TASK_CONCURRENCY value {value!r}, using 2")
+        concurrency = 2
+    return max(concurrency, 1)
+
+
+def _get_task_slots():
+    global _task_slots
+    if _task_slots is None:
+        _task_slots = asyncio.Semaphore(get_task_concurrency())
+    return _task_slots
+
+
+def prune_tasks():
+    """Forget finished tasks older than TASK_TTL_SECONDS."""
+    now = time.time()
+    expired = [
+        task_id for task_id, task in _tasks.items()
+        if task["finished"] is not None and now - task["finished"] > TASK_TTL_SECONDS
+    ]
+    for task_id in expired:
+        del _tasks[task_id]
+
+
+async def _run_task(task, work):
+    async with _get_task_slots():
+        task["status"] = "running"
+        task["startedAt"] = datetime.now().isoformat()
+        try:
+            result = await work(lambda completed: task.update(completed=completed))
+            if isinstance(result, dict) and "error" in result:
+                task["status"] = "failed"
+                task["error"] = result["error"]
+            else:
+                task["status"] = "completed"
+                task["completed"] = task["total"]
+                task["result"] = result
+        except asyncio.CancelledError:
+            task["status"] = "cancelled"
+            raise
+        except Exception as e:
+            print(f"Task {task['taskId']} failed: {str(e)}")
+            task["status"] = "failed"
+            task["error"] = str(e)
+        finally:
+            task["finishedAt"] = datetime.now().isoformat()
+            task["finished"] = time.time()
+            _running.pop(task["taskId"], None)
+
+
+def submit_task(kind, total, work):
+    """
+    Queue work(on_progress) to run in the background and return the new task id.
+    work is an async function; it calls on_progress(completed) as items finish and
+    returns the same response dict the synchronous endpoint would.
+    """
+    prune_tasks()
+    task_id = uuid.uuid4().hex
+    task = {
+        "taskId": task_id,
+        "kind": kind,
+        "status": "queued",
+        "completed": 0,
+        "total": total,
+        "createdAt": datetime.now().isoformat(),
+        "startedAt": None,
+        "finishedAt": None,
+        "finished": None,
+        "error": None,
+        "result": None,
+    }
+    _tasks[task_id] = task
+    _running[task_id] = asyncio.create_task(_run_task(task, work))
+    return task_id
+
+
+def get_task(task_id):
+    """Return the task record, or None for unknown or expired tasks."""
+    prune_tasks()
+    return _tasks.get(task_id)
+
+
+def task_status(task):
+    """Public status view of a task (without its result)."""
+    return {
+        "taskId": task["taskId"],
+        "kind": task["kind"],
+        "status": task["status"],
+        "progress": {"completed": task["completed"], "total": task["total"]},
+        "createdAt": task["createdAt"],
+        "startedAt": task["startedAt"],
+        "finishedAt": task["finishedAt"],
+        "error": task["error"],
+    }
+
+
+def cancel_tasks():
+    """Cancel tasks that are still queued or running (called on server shutdown)."""
+    for running in list(_running.values()):
+        running.cancel()
+
+
+async def gather_with_progress(aws, on_progress=None):
+    """asyncio.gather that also reports how many of the awaitables have finished."""
+    if on_progress is None:
+        return await asyncio.gather(*aws)
+    done = 0
+
+    async def tracked(aw):
+        nonlocal done
+        try:
+            return await aw
+        finally:
+            done += 1
+            on_progress(done)
+
+    return await asyncio.gather(*(tracked(aw) for aw in aws))
@@ -0,0 +1,58 @@
+import hashlib
+import os
+from io import BytesIO
+
+from utils.cache_store import cache_dir, create_cache_store
+from utils.pdf_extractors import get_pdf_backend
+from utils.resume_parser import PARSER_VERSION, extract_text_and_lines, extract_resume_sections
+
+# Extracted text is cached by file content, shared by every endpoint that parses resumes
+text_cache_dir = os.path.join(cache_dir, "text")
+text_cache = create_cache_store("text", json_dir=text_cache_dir)
+
+
+def get_content_hash(file_content: bytes) -> str:
+    """Content hash used as the text cache key (same scheme as the analysis cache)."""
+    return hashlib.md5(file_content).hexdigest()
+
+
+def load_extracted_text(file_hash: str):
+    """Load cached text and sections for a file hash, or None if missing or stale."""
+    entry = text_cache.get(file_hash)
+    # Entries written by an older parser or another PDF backend are ignored and overwritten
+    if entry is None or entry.get("parser_version") != PARSER_VERSION:
+        return None
+    if entry.get("pdf_backend") != get_pdf_backend().name:
+        return None
+    return entry
+
+
+def save_extracted_text(file_hash: str, text: str, sections: dict, line_index: dict):
+    """Save extracted text, sections and line index for a file hash."""
+    text_cache.set(file_hash, {
+        "parser_version": PARSER_VERSION,
+        "pdf_backend": get_pdf_backend().name,
+        "text": text,
+        "sections": sections,
+        "line_index": line_index
+    })
+
+
+def extract_text_cached(file_content: bytes, filename: str, file_hash: str = None, raw_text: str = None):
+    """
+    Return (text, sections, line_index) for a resume file, parsing it only on a cache miss.
+    raw_text is passed on to extract_text when the file's text was already read.
+    Raises the same errors as extract_text when the file cannot be parsed.
+    """
+    file_hash = file_hash or get_content_hash(file_content)
+    entry = load_extracted_text(file_hash)
+    if entry is not None:
+        print(f"Using cached text for {filename}")
+        return entry["text"], entry["sections"], entry["line_index"]
+
+    file_obj = BytesIO(file_content)
+    file_obj.filename = filename
+    text, line_index = extract_text_and_lines(file_obj, raw_text)
+    sections = extract_resume_sections(text, line_index)
+    save_extracted_text(file_hash, text, sections, line_index)
+    return text, sections, line_index
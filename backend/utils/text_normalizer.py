@@ -0,0 +1,82 @@
+import re
+import unicodedata
+from bisect import bisect_right
+
+WHITESPACE_RE = re.compile(r'\s+')
+# A bullet line starts with "•", or with "-" or "*" followed by a space (or nothing):
+# "•" is never anything else, while "-" and "*" also start ordinary text ("-based")
+BULLET = '•'
+SPACED_BULLET_CHARS = ('-', '*')
+
+
+def normalize_text(raw_text):
+    """
+    Normalize extracted text in one pass over its lines.
+
+    Returns (text, line_index). text is the flat text used everywhere: NFKD-normalized,
+    with every whitespace run collapsed to one space, exactly as before. line_index keeps
+    the layout that flattening loses, in a compact JSON-friendly form:
+    - "line_lengths": length of each non-blank line; line i starts where line i-1 ended
+      plus one (the space that replaced the line break)
+    - "paragraph_starts": numbers of the lines that follow a blank line
+    """
+    lengths = []
+    paragraph_starts = []
+    parts = []
+    after_blank = False
+    for line in unicodedata.normalize("NFKD", raw_text).splitlines():
+        line = WHITESPACE_RE.sub(' ', line).strip()
+        if not line:
+            after_blank = True
+            continue
+        if after_blank and lengths:
+            paragraph_starts.append(len(lengths))
+        after_blank = False
+        lengths.append(len(line))
+        parts.append(line)
+    return " ".join(parts), {"line_lengths": lengths, "paragraph_starts": paragraph_starts}
+
+
+def line_offsets(line_index):
+    """Start offset in the flat text of every line."""
+    offsets = []
+    offset = 0
+    for length in line_index["line_lengths"]:
+        offsets.append(offset)
+        offset += length + 1
+    return offsets
+
+
+def iter_lines(text, line_index):
+    """Yield each line of the flat text."""
+    offset = 0
+    for length in line_index["line_lengths"]:
+        yield text[offset:offset + length]
+        offset += length + 1
+
+
+def paragraph_offsets(line_index):
+    """Start offset in the flat text of every paragraph after the first."""
+    offsets = line_offsets(line_index)
+    return [offsets[line] for line in line_index["paragraph_starts"]]
+
+
+def split_at(text, start, end, boundaries):
+    """Split text[start:end] at the given sorted offsets that fall inside it."""
+    pieces = []
+    i = bisect_right(boundaries, start)
+    while i < len(boundaries) and boundaries[i] < end:
+        pieces.append(text[start:boundaries[i]])
+        start = boundaries[i]
+        i += 1
+    pieces.append(text[start:end])
+    return pieces
+
+
+def count_bullet_lines(text, line_index):
+    """Number of lines that start with a bullet (see BULLET)."""
+    count = 0
+    for line in iter_lines(text, line_index):
+        if line[0] == BULLET or (line[0] in SPACED_BULLET_CHARS and (len(line) == 1 or line[1] == ' ')):
+            count += 1
+    return count
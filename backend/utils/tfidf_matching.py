@@ -0,0 +1,99 @@
+import base64
+
+try:
+    import numpy as np
+    from scipy.sparse import csr_matrix
+    from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+except ImportError:
+    HashingVectorizer = None
+
+# Share of description_match that comes from TF-IDF similarity in tfidf mode
+TFIDF_WEIGHT = 0.5
+# Cosine similarity that earns the full TF-IDF share. Job descriptions are much
+# shorter than resumes, so even good matches stay low (0.03-0.08 on the sample uploads)
+TFIDF_FULL_SIMILARITY = 0.15
+DESCRIPTION_POINTS = 30
+
+# Term counts are hashed into a fixed space, so each resume's row can be computed
+# once, stored, and stacked with any other resumes later
+N_FEATURES = 2 ** 18
+
+_vectorizer = None
+
+
+def tfidf_available():
+    return HashingVectorizer is not None
+
+
+def get_vectorizer():
+    global _vectorizer
+    if _vectorizer is None:
+        _vectorizer = HashingVectorizer(n_features=N_FEATURES, stop_words="english",
+                                        alternate_sign=False, norm=None)
+    return _vectorizer
+
+
+def term_counts(text):
+    """
+    Hashed term counts of a text as [indices, counts], base64 strings of packed int32
+    indices and uint16 counts: JSON friendly, and decoded without going through Python
+    integers. Counts are capped at 65535 (tf is log-scaled anyway).
+    """
+    row = get_vectorizer().transform([text])
+    return [base64.b64encode(row.indices.astype(np.int32).tobytes()).decode("ascii"),
+            base64.b64encode(np.minimum(row.data, 65535).astype(np.uint16).tobytes()).decode("ascii")]
+
+
+def _unpack(packed, dtype):
+    return np.frombuffer(base64.b64decode(packed), dtype=dtype)
+
+
+def description_similarities(job_description, rows):
+    """
+    Cosine similarity between the job description and each resume, given the resumes'
+    term_counts rows. Builds the sparse TF-IDF matrix of the batch (IDF from the
+    resumes) and gets every similarity from one sparse matrix-vector product.
+    """
+    if not rows:
+        return np.zeros(0)
+    row_indices = [_unpack(indices, np.int32) for indices, _ in rows]
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum([len(indices) for indices in row_indices], out=indptr[1:])
+    indices = np.concatenate(row_indices)
+    counts = np.concatenate([_unpack(counts, np.uint16) for _, counts in rows]).astype(np.float64)
+    matrix = csr_matrix((counts, indices, indptr), shape=(len(rows), N_FEATURES))
+
+    transformer = TfidfTransformer(sublinear_tf=True)
+    resumes = transformer.fit_transform(matrix)
+    query = transformer.transform(get_vectorizer().transform([job_description or ""]))
+    # Rows are L2-normalized, so dot products are cosine similarities
+    return (resumes @ query.T).toarray().ravel()
+
+
+def blend_description_match(keyword_match, similarity):
+    """description_match from the keyword overlap points and the TF-IDF similarity."""
+    tfidf_points = DESCRIPTION_POINTS * min(similarity / TFIDF_FULL_SIMILARITY, 1.0)
+    return int((1 - TFIDF_WEIGHT) * keyword_match + TFIDF_WEIGHT * tfidf_points)
+
+
+def apply_tfidf_match(job_description, pairs, rows):
+    """
+    Re-score (index, result) pairs with TF-IDF description matching. rows[i] holds the
+    term counts of pairs[i] (None for results that could not be read, which are kept as
+    they are). Returns new pairs with descriptionMatch, matchScore and
+    descriptionSimilarity updated.
+    """
+    positions = [position for position, row in enumerate(rows) if row is not None]
+    similarities = description_similarities(job_description, [rows[position] for position in positions])
+    blended = list(pairs)
+    for position, similarity in zip(positions, similarities.tolist()):
+        index, result = pairs[position]
+        description_match = blend_description_match(result["descriptionMatch"], similarity)
+        match_score = result["skillsMatch"] + description_match + result["keywordsMatch"]
+        blended[position] = (index, {
+            **result,
+            "matchScore": min(100, max(0, match_score)),
+            "descriptionMatch": description_match,
+            "descriptionSimilarity": round(similarity, 4),
+        })
+    return blended
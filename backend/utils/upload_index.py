@@ -0,0 +1,99 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+
+from utils.workers import get_worker_count
+
+# Seconds between checks of the directory's modification time
+CHECK_INTERVAL = 1.0
+
+
+class UploadIndex:
+    """
+    File names of an uploads directory mapped to their paths.
+
+    The directory is rescanned only when its modification time changes (files were added,
+    removed or renamed), and that is checked at most every CHECK_INTERVAL seconds, so
+    looking up a resume that is in the directory needs no stat at all. A name that is not
+    in the index is still checked on disk, so a file added since the last check (or within
+    the directory's timestamp granularity) is not missed.
+    """
+
+    def __init__(self, directory):
+        # Paths joined onto the directory as given are recognized without normalizing them
+        self.given_directory = directory
+        self.directory = os.path.normpath(os.path.abspath(directory))
+        self.mtime = None
+        self.checked = None
+        self.paths = {}
+
+    def refresh(self):
+        now = time.monotonic()
+        if self.checked is not None and now - self.checked < CHECK_INTERVAL:
+            return
+        self.checked = now
+        try:
+            mtime = os.stat(self.directory).st_mtime_ns
+        except OSError:
+            self.paths, self.mtime = {}, None
+            return
+        if mtime == self.mtime:
+            return
+        # The mtime is read before scanning: a change during the scan triggers another one
+        paths = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    paths[entry.name] = entry.path
+        self.paths, self.mtime = paths, mtime
+
+    def exists(self, path):
+        """Like os.path.exists, answered from the index for files directly in the directory."""
+        directory, name = os.path.split(path)
+        if directory != self.given_directory:
+            directory, name = os.path.split(os.path.normpath(os.path.abspath(path)))
+            if directory != self.directory:
+                return os.path.exists(path)
+        return name in self.paths or os.path.exists(path)
+
+
+_upload_indexes = {}
+
+
+def get_upload_index(directory):
+    """The index of a directory (one per process), brought up to date with it."""
+    index = _upload_indexes.get(directory)
+    if index is None:
+        index = _upload_indexes[directory] = UploadIndex(directory)
+    index.refresh()
+    return index
+
+
+def get_max_open_files():
+    """How many resume files job matching loads or scores at once, configurable via RESUME_MAX_OPEN_FILES."""
+    value = os.environ.get("RESUME_MAX_OPEN_FILES", "").strip()
+    try:
+        files = int(value) if value else 0
+    except ValueError:
+        print(f"Invalid RESUME_MAX_OPEN_FILES value {value!r}, using default")
+        files = 0
+    if files <= 0:
+        files = 2 * get_worker_count()
+    return files
+
+
+_file_slots = None
+
+
+@asynccontextmanager
+async def file_slot():
+    """
+    Hold one of get_max_open_files() slots while a resume file is read and scored, so at
+    most that many files are in memory at once however many resumes a job has.
+    """
+    global _file_slots
+    if _file_slots is None:
+        _file_slots = asyncio.Semaphore(get_max_open_files())
+    async with _file_slots:
+        yield
@@ -0,0 +1,105 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+
+# Shared process pool for CPU-bound resume work (parsing, scoring, matching)
+_process_pool = None
+
+
+def get_worker_count():
+    """Number of worker processes, configurable via RESUME_WORKERS (defaults to all cores)."""
+    value = os.environ.get("RESUME_WORKERS", "").strip()
+    try:
+        workers = int(value) if value else 0
+    except ValueError:
+        print(f"Invalid RESUME_WORKERS value {value!r}, using CPU count")
+        workers = 0
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def get_pool_context():
+    """
+    Start method of the worker processes. Workers are started from a clean forkserver
+    (spawn where that is unavailable) rather than forked from the server, which has
+    threads running and open SQLite connections and locks that must not be copied.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def get_process_pool():
+    """Return the shared process pool, creating it on first use."""
+    global _process_pool
+    if _process_pool is None:
+        workers = get_worker_count()
+        _process_pool = ProcessPoolExecutor(max_workers=workers, mp_context=get_pool_context())
+        print(f"Started resume worker pool with {workers} processes")
+    return _process_pool
+
+
+def shutdown_process_pool():
+    """Shut down the shared process pool (called on server shutdown)."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+async def run_in_process_pool(func, *args):
+    """Run func(*args) in the shared process pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(get_process_pool(), func, *args)
+    except BrokenProcessPool:
+        # A worker died (e.g. killed by the OS); start a fresh pool for later calls
+        shutdown_process_pool()
+        raise
+
+
+class ServerBusy(Exception):
+    """Raised when too many resume analyses are already running or waiting."""
+
+
+# Single-resume analyses currently running or waiting for a slot
+_analysis_slots = None
+_analysis_pending = 0
+
+
+def get_max_queued_analyses():
+    """How many analyses may wait for a free slot, configurable via RESUME_MAX_QUEUED."""
+    value = os.environ.get("RESUME_MAX_QUEUED", "").strip()
+    try:
+        queued = int(value) if value else -1
+    except ValueError:
+        print(f"Invalid RESUME_MAX_QUEUED value {value!r}, using default")
+        queued = -1
+    if queued < 0:
+        queued = 4 * get_worker_count()
+    return queued
+
+
+@asynccontextmanager
+async def analysis_slot():
+    """
+    Hold one of get_worker_count() analysis slots while parsing and scoring a resume.
+    Callers beyond the slots wait in line; once RESUME_MAX_QUEUED are waiting, new
+    callers get ServerBusy right away instead of piling up behind the parsing work.
+    """
+    global _analysis_slots, _analysis_pending
+    workers = get_worker_count()
+    if _analysis_slots is None:
+        _analysis_slots = asyncio.Semaphore(workers)
+    if _analysis_pending >= workers + get_max_queued_analyses():
+        raise ServerBusy("Server is busy analyzing other resumes, please retry shortly")
+    _analysis_pending += 1
+    try:
+        async with _analysis_slots:
+            yield
+    finally:
+        _analysis_pending -= 1